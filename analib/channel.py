@@ -16,12 +16,102 @@ import ctypes as ct
 import logging
 import time
 import ipaddress
+import re
+import struct
 import threading
+from collections import deque
 
 # Other files in this package
 from .wrapper import dll, restart
 from .exception import DllException, CanNoMsg
-from .constants import CONNECT_STATES, BAUDRATES
+from .constants import CONNECT_STATES, BAUDRATES, OPERATING_MODES
+
+
+_IPV4_RE = re.compile(r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+                      r'(?:\.(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}')
+"""Compiled regular expression matching IPv4 addresses in dotted decimal
+notation. Used for a fast validation before falling back to
+:func:`ipaddress.ip_address`."""
+
+
+class _NoLock(object):
+    """Context manager which does nothing. It replaces the internal
+    :class:`~threading.Lock` of a :class:`Channel` opened without locking.
+    (:func:`contextlib.nullcontext` is not available in Python 3.6.)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        return False
+
+
+class _RxBuffer(ct.Structure):
+    """Contiguous memory for all output parameters of CANGetMessage_.
+
+    The field order avoids any padding so that the whole buffer can be decoded
+    with a single :data:`_RX_STRUCT` call instead of reading each
+    :mod:`ctypes` variable separately.
+    """
+    _fields_ = [('availMsgs', ct.c_uint32), ('identifier', ct.c_int32),
+                ('flags', ct.c_int32), ('seconds', ct.c_int32),
+                ('microseconds', ct.c_int32), ('dataLen', ct.c_uint8),
+                ('data', ct.c_char * 8)]
+
+
+_RX_STRUCT = struct.Struct('=IiiiiB8s')
+""":class:`struct.Struct` : Decodes the contents of a :class:`_RxBuffer`"""
+
+
+class _Scratch(object):
+    """Scratch :mod:`ctypes` variables for the |API| calls of one thread.
+
+    Every |API| call has finished before the next one on the same thread
+    starts, so all :class:`Channel` instances used by a thread can safely
+    share one set of these variables. Use :func:`_scratch` to get the instance
+    of the current thread.
+    """
+
+    def __init__(self):
+        # Receiving telegrams
+        self.rxBuffer = _RxBuffer()
+        views = {name: typ.from_buffer(self.rxBuffer,
+                                       getattr(_RxBuffer, name).offset)
+                 for name, typ in _RxBuffer._fields_}
+        self.rxArgs = (ct.byref(views['availMsgs']),
+                       ct.byref(views['identifier']), views['data'],
+                       ct.byref(views['dataLen']), ct.byref(views['flags']),
+                       ct.byref(views['seconds']),
+                       ct.byref(views['microseconds']))
+        # Reading the time
+        self.timeSeconds = ct.c_uint32()
+        self.timeMicroseconds = ct.c_uint32()
+        self.timeWasSet = ct.c_int32()
+        self.timeArgs = (ct.byref(self.timeWasSet),
+                         ct.byref(self.timeSeconds),
+                         ct.byref(self.timeMicroseconds))
+        # Sending telegrams
+        self.txIdentifier = ct.c_int32()
+        # The data bytes are written to a bytearray which accepts lists of
+        # integers as well as bytes-like objects without any conversion. The
+        # API reads them through a ctypes view on the same memory.
+        self.txData = bytearray(8)
+        self.txBuffer = (ct.c_char * 8).from_buffer(self.txData)
+        self.txBufferLen = ct.c_int32()
+        self.txFlags = ct.c_int32()
+
+
+_tls = threading.local()
+
+
+def _scratch():
+    """Returns the :class:`_Scratch` instance of the current thread. It is
+    created on first use."""
+    try:
+        return _tls.scratch
+    except AttributeError:
+        _tls.scratch = _Scratch()
+        return _tls.scratch
 
 
 def cbFunc(cobid, data, dlc, flags, handle):
@@ -37,8 +127,9 @@ def cbFunc(cobid, data, dlc, flags, handle):
     cobid : :obj:`int`
         11 bit |CAN| identifier of the telegram
     data : :func:`~ctypes.POINTER` of :class:`~ctypes.c_char`
-        Data bytes of the telegram. Use the :func:`~ctypes.string_at` function
-        to convert this to a :class:`bytes` object.
+        Data bytes of the telegram. Slice it (``data[:dlc]``) or use the
+        :func:`~ctypes.string_at` function to convert this to a :class:`bytes`
+        object.
     dlc : :obj:`int`
         Number of data bytes in the telegram
     flags : :obj:`int`
@@ -59,7 +150,7 @@ def cbFunc(cobid, data, dlc, flags, handle):
             while True:
                 pass
     """
-    data = ct.string_at(data, dlc)
+    data = data[:dlc]
     print('Calling callback function with the following arguments:')
     print(f'    COBID: {cobid:03X}; Data: {data[:dlc].hex()}; DLC: {dlc}; '
           f'Flags: {flags}; Handle: {handle}')
@@ -154,25 +245,38 @@ class Channel(object):
         confirmed by the |CAN| controller.
     maxSizePerQueue : :obj:`int`, optional
         Maximum size of the receive buffer. Defaults to 1000.
+    lock : :obj:`bool`, optional
+        If set to :data:`False`, the |API| calls are not guarded by
+        :attr:`lock`. This saves the locking overhead but should only be used
+        when the channel is accessed from a single thread or the |API|
+        serializes concurrent calls itself. Defaults to :data:`True`.
+    globalsMaxAge : :obj:`float`, optional
+        Maximum age in seconds of the locally stored global settings. When a
+        property like :attr:`baudrate` is read and the stored values are
+        older, all global settings are re-read from the device with a single
+        :func:`getGlobals` call. Defaults to :data:`None` which means that the
+        stored values are never re-read automatically.
     """
 
 
     def __init__(self, ipAddress='192.168.1.254', port=0, confirm=True,
                  ind=True, timeout=10000, baudrate=125000, operatingMode=0,
                  termination=True, highSpeedMode=False, timeStampOn=False,
-                 maxSizePerQueue=1000):
+                 maxSizePerQueue=1000, lock=True, globalsMaxAge=None):
 
         # Value checks
         if baudrate not in BAUDRATES:
             raise ValueError(f'Baudrate value {baudrate} is not allowed!')
-        if operatingMode not in range(4):
+        if operatingMode not in OPERATING_MODES:
             raise ValueError(f'Operating mode must be 0, 1, 2 or 3, but is '
                              f'{operatingMode}')
         # Raises ValueError if ipAddress is invalid
-        ipaddress.ip_address(ipAddress)
+        if _IPV4_RE.fullmatch(ipAddress) is None:
+            ipaddress.ip_address(ipAddress)
 
         # Initialize Lock
         self.__lock = threading.Lock()
+        self.__lockCtx = self.__lock if lock else _NoLock()
 
         # Initialize private attributes containing ctypes variables
         self.__deviceOpen = False
@@ -193,6 +297,36 @@ class Channel(object):
         self.__inputCount = ct.c_uint16(4)
         self.__analogInputs = (ct.c_uint32 * 4)()
 
+        # Python mirrors of the ctypes variables above. Reading the value of a
+        # ctypes object is much slower than reading a plain attribute, so the
+        # properties return these mirrors which are updated whenever the
+        # corresponding ctypes variables change.
+        self.__handleValue = 0
+        self.__portValue = port
+        self.__ipAddressValue = ipAddress
+        self.__sendDataConfirmValue = bool(confirm)
+        self.__sendDataIndValue = bool(ind)
+        self.__baudrateValue = baudrate
+        self.__operatingModeValue = operatingMode
+        self.__terminationValue = bool(termination)
+        self.__highSpeedModeValue = bool(highSpeedMode)
+        self.__timeStampOnValue = bool(timeStampOn)
+        self.__globalsMaxAge = globalsMaxAge
+        self.__globalsTimestamp = 0.
+        self._updateStr()
+
+        # Bind the API functions used for every telegram once so that the
+        # hot paths need no further lookups. The scratch variables for their
+        # arguments are shared per thread, see _scratch().
+        self.__CANGetMessage = dll.CANGetMessage
+        self.__CANWrite = dll.CANWrite
+
+        # Queue filled by the internal callback function, see
+        # startReceiveQueue(). It is never replaced because the callback may
+        # append to it at any time, so its size is limited by the callback.
+        self.__rxQueue = deque()
+        self.__rxCbFunc = None
+
         # Establish connection with Anagate partner and set configuration
         self._openDevice(ipAddress, port, confirm, ind, timeout)
         self.setGlobals()
@@ -201,8 +335,7 @@ class Channel(object):
         # self.setCallback(cbFunc)
 
     def __str__(self):
-        return (f'Anagate CAN channel: IP address: {self.ipAddress}; '
-                f'CAN port: {self.port}')
+        return self.__str
 
     __repr__ = __str__
 
@@ -211,7 +344,8 @@ class Channel(object):
 
     def __exit__(self, exception_type, exception_value, traceback):
         self.close()
-        logging.exception(exception_value)
+        if exception_value is not None:
+            logging.exception(exception_value)
         return True
 
     def __del__(self):
@@ -225,12 +359,12 @@ class Channel(object):
     @property
     def handle(self):
         """:obj:`int` : Access handle"""
-        return self.__handle.value
+        return self.__handleValue
 
     @property
     def port(self):
         """:obj:`int` : |CAN| port number"""
-        return self.__port.value
+        return self.__portValue
 
     @property
     def sendDataConfirm(self):
@@ -238,18 +372,18 @@ class Channel(object):
         requests are confirmed by the internal message protocol. Without
         confirmations a better transmission performance is reached.
         """
-        return bool(self.__sendDataConfirm.value)
+        return self.__sendDataConfirmValue
 
     @property
     def sendDataInd(self):
         """:obj:`bool` : If set to :data:`False`, all incoming telegrams are
         discarded."""
-        return bool(self.__sendDataInd.value)
+        return self.__sendDataIndValue
 
     @property
     def ipAddress(self):
         """:obj:`str` : Network address of the AnaGate partner."""
-        return self.__ipAddress.value.decode()
+        return self.__ipAddressValue
 
     @property
     def baudrate(self):
@@ -269,8 +403,8 @@ class Channel(object):
         * 1000000 für 1MBit
 
         """
-        self.getGlobals()
-        return self.__baudrate.value
+        self._checkGlobalsAge()
+        return self.__baudrateValue
 
     @baudrate.setter
     def baudrate(self, value):
@@ -298,13 +432,13 @@ class Channel(object):
           |CAN| devices send telegrams with a different baud rate.
 
         """
-        self.getGlobals()
-        return self.__operatingMode.value
+        self._checkGlobalsAge()
+        return self.__operatingModeValue
 
     @operatingMode.setter
     def operatingMode(self, value):
         assert type(value) is int
-        if value not in range(4):
+        if value not in OPERATING_MODES:
             raise ValueError(f'Operating mode must be 0, 1, 2 or 3, but is '
                              f'{value}')
         self.__operatingMode.value = value
@@ -316,8 +450,8 @@ class Channel(object):
 
         This setting is not supported by all AnaGate |CAN| models.
         """
-        self.getGlobals()
-        return bool(self.__termination.value)
+        self._checkGlobalsAge()
+        return self.__terminationValue
 
     @termination.setter
     def termination(self, value):
@@ -335,8 +469,8 @@ class Channel(object):
         high bus load. In this mode telegrams are not confirmed on the protocol
         layer and the software filters defined via CANSetFilter_ are ignored.
         """
-        self.getGlobals()
-        return bool(self.__highSpeedMode.value)
+        self._checkGlobalsAge()
+        return self.__highSpeedModeValue
 
     @highSpeedMode.setter
     def highSpeedMode(self, value):
@@ -355,8 +489,8 @@ class Channel(object):
         received by the |CAN| controller or when the outgoing message was
         confirmed by the |CAN| controller.
         """
-        self.getGlobals()
-        return bool(self.__timeStampOn.value)
+        self._checkGlobalsAge()
+        return self.__timeStampOnValue
 
     @timeStampOn.setter
     def timeStampOn(self, value):
@@ -382,6 +516,19 @@ class Channel(object):
             return CONNECT_STATES[self._deviceConnectState()]
         return 'DISCONNECTED'
 
+    @property
+    def globalsMaxAge(self):
+        """:obj:`float` : Maximum age in seconds of the locally stored global
+        settings before they are re-read from the device. :data:`None` means
+        that they are never re-read automatically."""
+        return self.__globalsMaxAge
+
+    @globalsMaxAge.setter
+    def globalsMaxAge(self, value):
+        if value is not None and value < 0:
+            raise ValueError(f'Value {value} of globalsMaxAge is < 0.')
+        self.__globalsMaxAge = value
+
     @property
     def maxSizePerQueue(self):
         """:obj:`int` : Maximum size of the receive buffer."""
@@ -394,6 +541,13 @@ class Channel(object):
             raise ValueError(f'Value {value} of maxSizePerQueue is < 0.')
         self._setMaxSizePerQueue(value)
         self.__maxSizePerQueue.value = value
+        # Trim the receive queue in place, discarding the oldest telegrams
+        rxQueue = self.__rxQueue
+        try:
+            while len(rxQueue) > value:
+                rxQueue.popleft()
+        except IndexError:
+            pass
 
     @property
     def deviceOpen(self):
@@ -497,7 +651,7 @@ class Channel(object):
         pcIPAddress = ct.create_string_buffer(bytes(ipAddress, 'utf-8'))
         nTimeout = ct.c_int32(timeout)
 
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANOpenDevice(ct.byref(self.__handle), bSendDataConfirm,
                               bSendDataInd, nCANPort, pcIPAddress, nTimeout)
 
@@ -505,12 +659,24 @@ class Channel(object):
         self.__sendDataConfirm = bSendDataConfirm
         self.__sendDataInd = bSendDataInd
         self.__ipAddress = pcIPAddress
+        self.__handleValue = self.__handle.value
+        self.__portValue = port
+        self.__sendDataConfirmValue = bool(confirm)
+        self.__sendDataIndValue = bool(ind)
+        self.__ipAddressValue = ipAddress
+        self._updateStr()
         self.__deviceOpen = True
         return True
 
+    def _updateStr(self):
+        """Formats the string representation of the channel once so that
+        :meth:`__str__` does not need to do it on every call."""
+        self.__str = (f'Anagate CAN channel: IP address: '
+                      f'{self.__ipAddressValue}; CAN port: {self.__portValue}')
+
     def _closeDevice(self):
         """Closes an open network connection to an AnaGate |CAN| device."""
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANCloseDevice(self.__handle)
         self.__deviceOpen = False
 
@@ -518,23 +684,31 @@ class Channel(object):
         """Close a connection.
 
         If the wrapped function returns an error the connection was already
-        closed and the error is ignored.
+        closed and the error is ignored. Nothing is done if the connection is
+        not open, so calling this method repeatedly is cheap.
         """
+        if not self.__deviceOpen:
+            return
         try:
             self.setCallback(ct.cast(None, dll.CBFUNC))
+            if self.__rxCbFunc is not None:
+                self.setCallbackEx(ct.cast(None, dll.CBFUNCEX))
+                self.__rxCbFunc = None
             self._closeDevice()
         except DllException:
-            pass
+            self.__deviceOpen = False
 
     def openChannel(self):
         """Opens a connection if it is not already open"""
         if not self.__deviceOpen:
-            return self._openDevice(self.ipAddress, self.port,
-                                    self.sendDataConfirm, self.sendDataInd)
+            ret = self._openDevice(self.ipAddress, self.port,
+                                   self.sendDataConfirm, self.sendDataInd)
+            self.refresh()
+            return ret
 
     def restart(self):
         """Restart the AnaGate device"""
-        with self.__lock:
+        with self.__lockCtx:
             restart(self.ipAddress)
 
     def setGlobals(self, baudrate=None, operatingMode=None, termination=None,
@@ -609,7 +783,7 @@ class Channel(object):
         timeStampOn = self.__timeStampOn if timeStampOn is None \
             else ct.c_int32(timeStampOn)
 
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANSetGlobals(self.__handle, baudrate, operatingMode,
                               termination, highSpeedMode, timeStampOn)
         self.__baudrate = baudrate
@@ -617,6 +791,7 @@ class Channel(object):
         self.__termination = termination
         self.__highSpeedMode = highSpeedMode
         self.__timeStampOn = timeStampOn
+        self._updateGlobalsMirrors()
 
     def getGlobals(self):
         """Gets the currently used global settings on the |CAN| bus.
@@ -626,12 +801,41 @@ class Channel(object):
 
         Saves the received values in the corresponding private attributes.
         """
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANGetGlobals(self.__handle, ct.byref(self.__baudrate),
                               ct.byref(self.__operatingMode),
                               ct.byref(self.__termination),
                               ct.byref(self.__highSpeedMode),
                               ct.byref(self.__timeStampOn))
+        self._updateGlobalsMirrors()
+
+    def _updateGlobalsMirrors(self):
+        """Updates the Python mirrors of the global settings from their
+        corresponding :mod:`ctypes` variables."""
+        self.__globalsTimestamp = time.monotonic()
+        self.__baudrateValue = self.__baudrate.value
+        self.__operatingModeValue = self.__operatingMode.value
+        self.__terminationValue = bool(self.__termination.value)
+        self.__highSpeedModeValue = bool(self.__highSpeedMode.value)
+        self.__timeStampOnValue = bool(self.__timeStampOn.value)
+
+    def _checkGlobalsAge(self):
+        """Re-reads the global settings if they are older than
+        :attr:`globalsMaxAge`."""
+        if self.__globalsMaxAge is not None and \
+                time.monotonic() - self.__globalsTimestamp > \
+                self.__globalsMaxAge:
+            self.getGlobals()
+
+    def refresh(self):
+        """Re-reads the global settings from the AnaGate device.
+
+        The properties for the global settings only return the locally stored
+        values which are kept up to date by :func:`setGlobals`. Call this
+        method if the settings may have been changed by another connection to
+        the same |CAN| interface.
+        """
+        self.getGlobals()
 
     def setTime(self, seconds=None, microseconds=0):
         """Sets the current system time on the AnaGate device.
@@ -651,14 +855,9 @@ class Channel(object):
             Micro seconds. Defaults to 0.
         """
         if seconds is None:
-            seconds = time.time()
-            microseconds = int((seconds - int(seconds)) * 1000000)
-            seconds = int(seconds)
-        seconds = ct.c_uint32(seconds)
-        microseconds = ct.c_uint32(microseconds)
-
-        with self.__lock:
-            dll.CANSetTime(self.__handle, seconds, microseconds)
+            seconds, microseconds = divmod(round(time.time() * 1e6), 1000000)
+        with self.__lockCtx:
+            dll.CANSetTime(self.__handle, int(seconds), microseconds)
 
     def getTime(self):
         """Gets the current system time from the AnaGate CAN device.
@@ -675,14 +874,10 @@ class Channel(object):
         microseconds : :obj:`int`
             Additional microseconds.
         """
-        seconds = ct.c_uint32()
-        microseconds = ct.c_uint32()
-        timeWasSet = ct.c_int32()
-
-        with self.__lock:
-            dll.CANGetTime(self.__handle, ct.byref(timeWasSet),
-                           ct.byref(seconds), ct.byref(microseconds))
-        return seconds.value, microseconds.value
+        sc = _scratch()
+        with self.__lockCtx:
+            dll.CANGetTime(self.__handle, *sc.timeArgs)
+        return sc.timeSeconds.value, sc.timeMicroseconds.value
 
     def write(self, identifier, data, flags=0):
         """Sends a |CAN| telegram to the |CAN| bus via the AnaGate device.
@@ -692,9 +887,9 @@ class Channel(object):
         identifier : :obj:`int`
             |CAN| identifier of the sender. Parameter flags defines whether the
             address is in extended format (29-bit) or standard format (11-bit).
-        data : :obj:`list` of :obj:`int`
-            Data content given as a list of integers. Data length is computed
-            from this list.
+        data : :obj:`list` of :obj:`int` or :obj:`bytes`
+            Data content given as a list of integers or a bytes-like object.
+            Data length is computed from this sequence and must not exceed 8.
         flags : :obj:`int`, optional
             The format flags are defined as follows:
 
@@ -704,14 +899,71 @@ class Channel(object):
             * Bit 2: If set, the telegram has a valid timestamp. This bit is
               only set for incoming data telegrams and doesn't need to be set
               for the CANWrite_ and CANWriteEx_ functions.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            If more than 8 data bytes are given.
         """
-        buffer = ct.create_string_buffer(bytes(data))
-        bufferLen = ct.c_int32(len(data))
-        flags = ct.c_int32(flags)
-        identifier = ct.c_int32(identifier)
+        bufferLen = len(data)
+        if bufferLen > 8:
+            raise ValueError(f'CAN telegrams can contain at most 8 data '
+                             f'bytes, but got {bufferLen}')
+
+        sc = _scratch()
+        sc.txData[:bufferLen] = data
+        sc.txBufferLen.value = bufferLen
+        sc.txFlags.value = flags
+        sc.txIdentifier.value = identifier
+        with self.__lockCtx:
+            self.__CANWrite(self.__handle, sc.txIdentifier, sc.txBuffer,
+                            sc.txBufferLen, sc.txFlags)
+
+    def writeMany(self, frames):
+        """Sends several |CAN| telegrams to the |CAN| bus via the AnaGate
+        device.
 
-        with self.__lock:
-            dll.CANWrite(self.__handle, identifier, buffer, bufferLen, flags)
+        The telegrams are sent with one CANWrite_ call each but the lock is
+        acquired only once for all of them and the return codes are checked
+        inline instead of by a :mod:`ctypes` error-check function. Use this
+        instead of repeated :func:`write` calls for bursts of telegrams.
+
+        Parameters
+        ----------
+        frames : iterable of :obj:`tuple`
+            Telegrams given as ``(identifier, data, flags)`` tuples. The
+            meaning of the elements is the same as for the parameters of
+            :func:`write`.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            If a telegram contains more than 8 data bytes. All telegrams
+            before that one have already been sent.
+        :exc:`~.exception.DllException`
+            If the |API| function returned an error. All telegrams before that
+            one have already been sent.
+        """
+        sc = _scratch()
+        canWrite = dll.CANWriteUnchecked
+        handle = self.__handle
+        txIdentifier, txData, txBuffer = \
+            sc.txIdentifier, sc.txData, sc.txBuffer
+        txBufferLen, txFlags = sc.txBufferLen, sc.txFlags
+        with self.__lockCtx:
+            for identifier, data, flags in frames:
+                bufferLen = len(data)
+                if bufferLen > 8:
+                    raise ValueError(f'CAN telegrams can contain at most 8 '
+                                     f'data bytes, but got {bufferLen}')
+                txData[:bufferLen] = data
+                txBufferLen.value = bufferLen
+                txFlags.value = flags
+                txIdentifier.value = identifier
+                rc = canWrite(handle, txIdentifier, txBuffer, txBufferLen,
+                              txFlags)
+                if rc:
+                    raise DllException(rc)
 
     def _setMaxSizePerQueue(self, maxSize):
         """Sets the maximum size of the queue that buffers received |CAN|
@@ -745,7 +997,7 @@ class Channel(object):
         """
         maxSize = ct.c_uint32(maxSize)
 
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANSetMaxSizePerQueue(self.__handle, maxSize)
 
     def getMessage(self):
@@ -777,25 +1029,61 @@ class Channel(object):
         ------
         :exc:`~.exception.CanNoMsg`
             If there no available |CAN| messages in the buffer
+        :exc:`~.exception.DllException`
+            If the |API| function returned an error
         """
-        availMsgs = ct.c_uint32()
-        identifier = ct.c_int32()
-        data = ct.create_string_buffer(8)
-        dataLen = ct.c_uint8()
-        flags = ct.c_int32()
-        seconds = ct.c_int32()
-        microseconds = ct.c_int32()
-
-        with self.__lock:
-            dll.CANGetMessage(self.__handle, ct.byref(availMsgs),
-                              ct.byref(identifier), data, ct.byref(dataLen),
-                              ct.byref(flags), ct.byref(seconds),
-                              ct.byref(microseconds))
-
-        if availMsgs.value == ct.c_uint32(-1).value:
+        sc = _scratch()
+        with self.__lockCtx:
+            rc = self.__CANGetMessage(self.__handle, *sc.rxArgs)
+        if rc:
+            raise DllException(rc)
+        availMsgs, cobid, flags, seconds, microseconds, dlc, data = \
+            _RX_STRUCT.unpack_from(sc.rxBuffer)
+        if availMsgs == 0xFFFFFFFF:
             raise CanNoMsg
-        return identifier.value, data.raw[:dataLen.value], dataLen.value, \
-            flags.value, seconds.value + microseconds.value / 1000000
+        return cobid, data[:dlc], dlc, flags, seconds + microseconds / 1000000
+
+    def getMessages(self, maxMessages=64):
+        """Returns several received |CAN| telegrams from the receive queue.
+
+        The receive queue is drained with repeated CANGetMessage_ calls while
+        the lock is acquired only once. This is much faster than calling
+        :func:`getMessage` for each telegram when the bus load is high.
+
+        Parameters
+        ----------
+        maxMessages : :obj:`int`, optional
+            Maximum number of telegrams to be returned. Defaults to 64.
+
+        Returns
+        -------
+        :obj:`list` of :obj:`tuple`
+            Received telegrams in the order of their reception. Each telegram
+            is given as a tuple in the same form as returned by
+            :func:`getMessage`. The list is empty if there are no available
+            |CAN| messages in the buffer.
+        """
+        messages = []
+        getMessage = self.__CANGetMessage
+        handle = self.__handle
+        sc = _scratch()
+        args = sc.rxArgs
+        rxBuffer = sc.rxBuffer
+        unpack = _RX_STRUCT.unpack_from
+        with self.__lockCtx:
+            while len(messages) < maxMessages:
+                rc = getMessage(handle, *args)
+                if rc:
+                    raise DllException(rc)
+                availMsgs, cobid, flags, seconds, microseconds, dlc, data = \
+                    unpack(rxBuffer)
+                if availMsgs == 0xFFFFFFFF:
+                    break
+                messages.append((cobid, data[:dlc], dlc, flags,
+                                 seconds + microseconds / 1000000))
+                if availMsgs == 0:
+                    break
+        return messages
 
     def _deviceConnectState(self):
         """Retrieves the current network connection state of the current
@@ -825,7 +1113,7 @@ class Channel(object):
               successfully initialized.
 
         """
-        with self.__lock:
+        with self.__lockCtx:
             return dll.CANDeviceConnectState(self.__handle)
 
     def startAlive(self, aliveTime=1):
@@ -853,7 +1141,7 @@ class Channel(object):
             1 s.
         """
 
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANStartAlive(self.__handle, ct.c_int32(aliveTime))
 
     def setCallback(self, callbackFunction):
@@ -872,9 +1160,118 @@ class Channel(object):
             parameters of the callback function are described in the
             documentation of the CANWrite_ function.
         """
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANSetCallback(self.__handle, callbackFunction)
 
+    def setCallbackEx(self, callbackFunction):
+        """Defines an asynchronous callback function which is called for each
+        incoming |CAN| telegram and additionally gets its timestamp.
+
+        This works like :func:`setCallback` but the callback function has two
+        additional parameters after the handle: the seconds and microseconds
+        of the telegram timestamp. These are only set if
+        :attr:`timeStampOn` is enabled.
+
+        Parameters
+        ----------
+        callbackFunction
+            Function pointer of type :attr:`~.dll.libCANDLL.CBFUNCEX` to the
+            private callback function. Set this parameter to NULL to
+            deactivate the callback function.
+        """
+        with self.__lockCtx:
+            dll.CANSetCallbackEx(self.__handle, callbackFunction)
+
+    def startReceiveQueue(self):
+        """Collects incoming |CAN| telegrams in an internal queue.
+
+        An internal callback function is registered via :func:`setCallbackEx`
+        which appends every incoming telegram to a :class:`collections.deque`
+        holding at most :attr:`maxSizePerQueue` telegrams; the oldest ones
+        are discarded when it is full. The telegrams can then be taken from
+        this queue with :func:`popMessage` and :func:`popMessages` without any
+        |API| call or lock.
+
+        The callback function does as little as possible per telegram. If
+        :attr:`timeStampOn` is enabled the timestamp of the device is used,
+        otherwise the time of the callback is taken.
+
+        Note
+        ----
+        Since a callback function is used, newly received telegrams are not
+        added to the receive queue of the |API| anymore and can therefore not
+        be read with :func:`getMessage` or :func:`getMessages`.
+        """
+        rxQueue = self.__rxQueue
+        maxSize = self.__maxSizePerQueue
+
+        def cbFunc(cobid, data, dlc, flags, handle, seconds, microseconds):
+            # Slicing the pointer copies the data bytes without the foreign
+            # function call needed by ct.string_at
+            rxQueue.append((cobid, data[:dlc], dlc, flags,
+                            seconds + microseconds / 1000000 if seconds
+                            else time.time()))
+            if len(rxQueue) > maxSize.value:
+                try:
+                    rxQueue.popleft()
+                except IndexError:
+                    # Emptied by the reading thread in the meantime
+                    pass
+
+        # Keep a reference to the function pointer to protect it from garbage
+        # collection
+        self.__rxCbFunc = dll.CBFUNCEX(cbFunc)
+        self.setCallbackEx(self.__rxCbFunc)
+
+    def popMessage(self):
+        """Returns the oldest telegram collected by the internal callback
+        function which is set by :func:`startReceiveQueue`.
+
+        Returns
+        -------
+        :obj:`tuple`
+            The telegram in the same form as returned by :func:`getMessage`.
+            The timestamp is taken when the callback function is called.
+
+        Raises
+        ------
+        :exc:`~.exception.CanNoMsg`
+            If there no available |CAN| messages in the queue
+        """
+        try:
+            return self.__rxQueue.popleft()
+        except IndexError:
+            raise CanNoMsg
+
+    def popMessages(self, maxMessages=64):
+        """Returns several telegrams collected by the internal callback
+        function which is set by :func:`startReceiveQueue`.
+
+        Parameters
+        ----------
+        maxMessages : :obj:`int`, optional
+            Maximum number of telegrams to be returned. If set to
+            :data:`None`, all telegrams which are currently in the queue are
+            returned at once. Defaults to 64.
+
+        Returns
+        -------
+        :obj:`list` of :obj:`tuple`
+            Telegrams in the order of their reception in the same form as
+            returned by :func:`popMessage`. The list is empty if there are no
+            available |CAN| messages in the queue.
+        """
+        if maxMessages is None:
+            maxMessages = len(self.__rxQueue)
+        messages = []
+        popleft = self.__rxQueue.popleft
+        try:
+            while len(messages) < maxMessages:
+                messages.append(popleft())
+        except IndexError:
+            pass
+        return messages
+
     def _readDigital(self):
         """Reads the current values of digital input and output registers of
         the AnaGate device.
@@ -888,7 +1285,7 @@ class Channel(object):
         The values are stored in internal attributes and can be accessed via
         their respective properties.
         """
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANReadDigital(self.__handle, ct.byref(self.__inputBits),
                                ct.byref(self.__outputBits))
 
@@ -902,7 +1299,7 @@ class Channel(object):
         connectors for 2 digital inputs and 2 digital outputs at the top side
         instead.
         """
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANWriteDigital(self.__handle, self.__outputBits)
 
     def _readAnalog(self):
@@ -917,7 +1314,7 @@ class Channel(object):
         The values are saved in internal attributes and can be accessed via
         the respective properties.
         """
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANReadAnalog(self.__handle, ct.byref(self.__powerSupply),
                               self.__analogInputs, ct.byref(self.__inputCount))
 
@@ -938,7 +1335,7 @@ class Channel(object):
             Array of 4 new analog output values in millivolt.
         """
         outputCount = len(analogOutputs)
-        with self.__lock:
+        with self.__lockCtx:
             dll.CANWriteAnalog(self.__handle,
                                (ct.c_uint32 * outputCount)(*analogOutputs),
                                ct.c_uint16(outputCount))
\ No newline at end of file
@@ -7,11 +7,16 @@ Some constants for AnaGate |CAN| devices
 :Organization: Bergische Universität Wuppertal
 """
 
-CONNECT_STATES = {1: 'DISCONNECTED', 2: 'CONNECTING', 3: 'CONNECTED',
-                  4: 'DISCONNECTING', 5: 'NOT_INITIALIZED'}
-""":obj:`dict` : Integer connection states and their corresponding strings"""
+CONNECT_STATES = (None, 'DISCONNECTED', 'CONNECTING', 'CONNECTED',
+                  'DISCONNECTING', 'NOT_INITIALIZED')
+""":obj:`tuple` of :obj:`str` : Strings corresponding to the integer connection
+states. The states start at 1, so the first element is a placeholder."""
 
-BAUDRATES = [10000, 20000, 50000, 62500, 100000, 125000, 250000, 500000,
-             1000000]
-""":obj:`list` of :obj:`int` : All possible baudrates for AnaGate |CAN| devices
-in Hertz"""
+BAUDRATES = frozenset({10000, 20000, 50000, 62500, 100000, 125000, 250000,
+                       500000, 1000000})
+""":obj:`frozenset` of :obj:`int` : All possible baudrates for AnaGate |CAN|
+devices in Hertz"""
+
+OPERATING_MODES = frozenset({0, 1, 2, 3})
+""":obj:`frozenset` of :obj:`int` : All possible operating modes for AnaGate
+|CAN| devices"""
@@ -13,7 +13,21 @@ from . import dllLoader
 from .exception import DllException
 
 
-_no_errcheck = dllLoader.no_errcheck
+def _error_check(result, func, arguments):
+    """Default error function used in :mod:`ctype` calls for :mod:`canlib`
+    |DLL|.
+
+    This is a plain function instead of a bound method so that no attribute
+    lookup is needed when :mod:`ctypes` calls it after every |API| call.
+
+    Raises
+    ------
+    :exc:`~.exception.DllException`
+        If the return code from an |API| function does not equal 0.
+    """
+    if result:
+        raise DllException(result)
+    return result
 
 
 class libCANDLL(dllLoader.MyDll):
@@ -28,7 +42,7 @@ class libCANDLL(dllLoader.MyDll):
     """Function type for callback functions which use the timestamp"""
 
     function_prototypes = {
-        'DLLInfo': [[ct.c_char_p, ct.c_int32], ct.c_int32, _no_errcheck],
+        'DLLInfo': [[ct.c_char_p, ct.c_int32], ct.c_int32, None],
         'CANOpenDevice': [[ct.POINTER(ct.c_int32), ct.c_int32,
                            ct.c_int32, ct.c_int32, ct.c_char_p, ct.c_int32]],
         'CANOpenDeviceEx': [[ct.POINTER(ct.c_int32), ct.c_int32,
@@ -57,7 +71,7 @@ class libCANDLL(dllLoader.MyDll):
                            ct.POINTER(ct.c_int32), ct.c_char_p,
                            ct.POINTER(ct.c_uint8), ct.POINTER(ct.c_int32),
                            ct.POINTER(ct.c_int32), ct.POINTER(ct.c_int32)],
-                          ct.c_int32],
+                          ct.c_int32, None],
         'CANReadDigital': [[ct.c_int32, ct.POINTER(ct.c_uint32),
                             ct.POINTER(ct.c_uint32)]],
         'CANWriteDigital': [[ct.c_int32, ct.c_uint32]],
@@ -67,9 +81,9 @@ class libCANDLL(dllLoader.MyDll):
                            ct.POINTER(ct.c_uint16)]],
         'CANWriteAnalog': [[ct.c_int32, ct.c_uint32 * 4, ct.c_uint16]],
         'CANRestart': [[ct.c_char_p, ct.c_int32]],
-        'CANDeviceConnectState': [[ct.c_int32], ct.c_int32, _no_errcheck],
+        'CANDeviceConnectState': [[ct.c_int32], ct.c_int32, None],
         'CANErrorMessage': [[ct.c_int32, ct.c_char_p, ct.c_int32], ct.c_int32,
-                            _no_errcheck]
+                            None]
         }
     """:obj:`dict` : Function prototypes.
 
@@ -80,25 +94,23 @@ class libCANDLL(dllLoader.MyDll):
 
     All types are :mod:`ctypes` classes. It is possible to omit the return type
     and the name of the error-check function if you have suitable default
-    values defined in the :meth:`__init__` method.
+    values defined in the :meth:`__init__` method. An error-check function of
+    :data:`None` installs no error check at all; the caller then has to check
+    the return code itself. This is used for functions which do not return
+    error codes and for ``CANGetMessage`` which is polled at a high rate.
     """
 
     def __init__(self, ct_dll):
         # set default values for function_prototypes
         self.default_restype = ct.c_int32
-        self.default_errcheck = self._error_check
+        self.default_errcheck = _error_check
         super(libCANDLL, self).__init__(ct_dll, **self.function_prototypes)
 
-    def _error_check(self, result, func, arguments):
-        """Default error function used in :mod:`ctype` calls for :mod:`canlib`
-        |DLL|.
-
-        Raises
-        ------
-        :exc:`~.exception.DllException`
-            If the return code from an |API| function does not equal 0.
-        """
-        if result != 0:
-            raise DllException(result)
-        else:
-            return result
\ No newline at end of file
+        # Separate function pointer to CANWrite without any error-check
+        # function for sending bursts of telegrams where the return codes are
+        # checked by the caller
+        self.CANWriteUnchecked = ct_dll['CANWrite']
+        self.CANWriteUnchecked.argtypes = self.CANWrite.argtypes
+        self.CANWriteUnchecked.restype = self.CANWrite.restype
+
+    _error_check = staticmethod(_error_check)
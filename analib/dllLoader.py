@@ -33,6 +33,9 @@ def annotate(dll_object, function_name, argtypes,
     `default_errcheck`, respectively. These values will then be used when
     setting the function's `argtypes` and `restype` attributes.
 
+    If `errcheck` is None, no error check function is installed at all and
+    the caller has to check the return value itself.
+
     """
     function = get_dll_function(dll_object._dll, function_name)
     function.argtypes = argtypes
@@ -42,7 +45,10 @@ def annotate(dll_object, function_name, argtypes,
     function.restype = restype
     if errcheck is DEFAULT:
         errcheck = dll_object.default_errcheck
-    function.errcheck = errcheck
+    # ctypes does not accept None, so just leave errcheck unset in that case
+    # which saves a Python-level call for every function call
+    if errcheck is not None:
+        function.errcheck = errcheck
     setattr(dll_object, function_name, function)
 
 
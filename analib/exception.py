@@ -20,11 +20,15 @@ class DllException(AnalibException):
     code from the |API| function.
     """
 
-    @staticmethod
-    def _get_error_text(rc):
-        # import here to prevent circular imports
-        from .wrapper import errorMessage
-        return errorMessage(rc)
+    _errorMessage = None
+
+    @classmethod
+    def _get_error_text(cls, rc):
+        if cls._errorMessage is None:
+            # import here to prevent circular imports; done only once
+            from .wrapper import errorMessage
+            cls._errorMessage = staticmethod(errorMessage)
+        return cls._errorMessage(rc)
 
     def __init__(self, rc):
         self.rc = rc
@@ -9,17 +9,24 @@ functions that do not require a valid handle.
 """
 import os
 import ctypes as ct
+import functools
 import sys
 import platform
+import threading
 
 from .dll import libCANDLL
 from .exception import DllException
 
+_SYS = sys.platform
+_IS64 = platform.machine().endswith('64')
 
+
+@functools.lru_cache(maxsize=1)
 def loadDLL():
     """Load AnaGate |API| libaries.
 
-    This function handles the platform-specific stuff.
+    This function handles the platform-specific stuff. The libraries are only
+    loaded on the first call; later calls return the same library object.
 
     Returns
     -------
@@ -34,22 +41,22 @@ def loadDLL():
 
     f_dir = os.path.dirname(os.path.abspath(__file__))
     ext = ''
-    if platform.machine().endswith('64'):
+    if _IS64:
         ext = '64'
         lib_dir = os.path.join(f_dir, 'lib', 'x86_64')
     else:
         lib_dir = os.path.join(f_dir, 'lib', 'x86')
 
-    if sys.platform.startswith('win32'):
+    if _SYS.startswith('win32'):
         lib_name = f'AnaGateCan{ext}.dll'
-    elif sys.platform.startswith('linux'):
+    elif _SYS.startswith('linux'):
         lib_name = f'libCANDLLRelease{ext}.so'
         ct.cdll.LoadLibrary(os.path.join(lib_dir, 'libAnaGateRelease.so'))
         ct.cdll.LoadLibrary(os.path.join(lib_dir, 'libAnaGateExtRelease.so'))
     else:
-        raise ValueError(f'Unknown platform: {sys.platorm}')
+        raise ValueError(f'Unknown platform: {_SYS}')
     lib_path = os.path.join(lib_dir, lib_name)
-    if sys.platform.startswith('win32'):
+    if _SYS.startswith('win32'):
         return ct.WinDLL(lib_path)
     else:
         return ct.CDLL(lib_path)
@@ -60,6 +67,11 @@ dll = libCANDLL(loadDLL())
 :mod:`ctypes` library. The exact type is platform specific."""
 
 
+# Preallocated text buffer for errorMessage(); guarded by _errLock
+_errBuf = ct.create_string_buffer(128)
+_errLock = threading.Lock()
+
+
 def dllInfo():
     """Determines the current version information of the AnaGate |DLL|.
 
@@ -69,9 +81,8 @@ def dllInfo():
         Version reference string of the AnaGate |DLL|.
     """
     buf = ct.create_string_buffer(128)
-    nMessageLen = ct.c_int32(128)
 
-    dll.DLLInfo(buf, nMessageLen)
+    dll.DLLInfo(buf, len(buf))
     return buf.value.decode()
 
 
@@ -93,12 +104,9 @@ def errorMessage(returnCode):
     :obj:`str`
         Error description.
     """
-    buf = ct.create_string_buffer(128)
-    buflen = ct.c_int32(128)
-    nRC = ct.c_int32(returnCode)
-
-    dll.CANErrorMessage(nRC, buf, buflen)
-    return buf.value.decode()
+    with _errLock:
+        dll.CANErrorMessage(returnCode, _errBuf, len(_errBuf))
+        return _errBuf.value.decode()
 
 
 def restart(ipAddress='192.168.1.254', timeout=10000):
@@ -119,8 +127,9 @@ def restart(ipAddress='192.168.1.254', timeout=10000):
         reported if the AnaGate partner does not respond within the defined
         timeout period. Defaults to 10 s.
     """
-    ipAddress = ct.c_char_p(bytes(ipAddress, 'utf-8'))
-    dll.CANRestart(ipAddress, ct.c_int32(timeout))
+    # ctypes converts bytes and int arguments according to the argtypes, so
+    # no wrapper objects are needed
+    dll.CANRestart(ipAddress.encode('utf-8'), timeout)
 
 
 def errorCheck(returnCode):
@@ -1,24 +1,38 @@
-from opcua import Client
+from opcua import Client, ua
 import time
 
+
+class SubHandler(object):
+    """Caches the latest value of every subscribed node"""
+
+    def __init__(self):
+        self.values = {}
+
+    def datachange_notification(self, node, val, data):
+        self.values[node.nodeid.Identifier] = val
+
+
 # define the OPCUA address
 url ="opc.tcp://localhost:4840/"
 client=Client(url)
 client.connect()
 print('The OPCUA Client connected')    
 
+# The NodeIds are constant, so build them (and their nodes) once
+nodes = [client.get_node(ua.NodeId(i, 2)) for i in (8476, 8530, 10395)]
+
+# Let the server push value changes instead of polling every cycle
+handler = SubHandler()
+sub = client.create_subscription(500, handler)
+sub.subscribe_data_change(nodes)
+
 while True:
-    get_ADCTRIM = client.get_node("ns=2;i=8476")
-    ADCTRIM = get_ADCTRIM.get_value()
-    
-    get_NodeID = client.get_node("ns=2;i=8530")
-    NodeID =get_NodeID.get_value()
-    
-    get_Status = client.get_node("ns=2;i=10395")
-    Status = get_Status.get_value()
+    ADCTRIM = handler.values.get(8476)
+    NodeID = handler.values.get(8530)
+    Status = handler.values.get(10395)
     
     
-    Info = "Time: %s | Status: %s | NodeID: %i |  ADCTRIM: %i" %(time.ctime(), Status, NodeID, ADCTRIM)
+    Info = "Time: %s | Status: %s | NodeID: %s |  ADCTRIM: %s" %(time.ctime(), Status, NodeID, ADCTRIM)
     print(Info)
     
-    time.sleep(2)
\ No newline at end of file
+    time.sleep(2)
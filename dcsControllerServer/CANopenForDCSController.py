@@ -5,31 +5,54 @@
 import os
 import random as rdm
 import logging
-from logging.handlers import RotatingFileHandler
-from math import ceil
-from time import strftime, sleep
-from datetime import timedelta
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from queue import Queue
+from time import strftime, sleep, monotonic
 from argparse import ArgumentParser
+from collections import deque
+from threading import Thread, Event
 
 # Third party modules
 import coloredlogs as cl
 import verboselogs
-from canlib import canlib, Frame
+from canlib import canlib
 
 # Other files
 try:
     from . import CANopenConstants as coc
     from .CANopenConstants import sdoAbortCodes as SAC
     from .objectDictionary import objectDictionary as od
-    from .extend_logging import extend_logging
+    from .extend_logging import extend_logging, SecondCachingFormatter
 except (ModuleNotFoundError, ImportError):
     import CANopenConstants as coc
     from CANopenConstants import sdoAbortCodes as SAC
     from objectDictionary import objectDictionary as od
-    from extend_logging import extend_logging
+    from extend_logging import extend_logging, SecondCachingFormatter
 
 
-PSPP_MAX_VALUES = [256, 256, 4, 256, 4, 4, 256, 8, 256, 4, 8, 256, 256]
+# Number of bits of the PSPP registers. All register values are random numbers
+# with this many bits, which getrandbits creates much faster than randrange.
+PSPP_REGISTER_BITS = [8, 8, 2, 8, 2, 2, 8, 3, 8, 2, 3, 8, 8]
+
+# Command bytes of expedited SDO download requests with size indicated
+SDO_WRITE_COMMANDS = frozenset((0x23, 0x27, 0x2b, 0x2f))
+
+# Command bytes of expedited SDO upload responses indexed by the data size
+SDO_EXPEDITED_UPLOAD_COMMANDS = tuple(
+    (((0b0100 << 2) | ((4 - datasize) & 0b11)) << 2) | 0b11
+    for datasize in range(5))
+
+
+def _formatTimestamp(ms):
+    """Format a timestamp in milliseconds like :class:`datetime.timedelta`
+    does, i.e. as ``H:MM:SS`` or ``H:MM:SS.ffffff``, without creating a
+    :class:`~datetime.timedelta` object. Days are counted as hours."""
+    s, us = divmod(round(ms * 1000), 1000000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    if us:
+        return f'{h:d}:{m:02d}:{s:02d}.{us:06d}'
+    return f'{h:d}:{m:02d}:{s:02d}'
 
 
 class ChipNotConnectedError(Exception):
@@ -68,15 +91,24 @@ class CANopenDCSController(object):
                                         maxBytes=10 * 1024 * 1024)
         self.__cfh = RotatingFileHandler(fname + 'CANmsg.log', backupCount=10,
                                          maxBytes=10 * 1024 * 1024)
-        fmt = logging.Formatter(logformat)
+        fmt = SecondCachingFormatter(logformat)
         fmt.default_msec_format = '%s.%03d'
         self.__fh.setFormatter(fmt)
         self.__cfh.setFormatter(fmt)
         cl.install(fmt=logformat, level=loglevel, isatty=True)
         self.__fh.setLevel(logging.DEBUG)
         self.__cfh.setLevel(logging.DEBUG)
-        self.logger.addHandler(self.__fh)
-        self.canLogger.addHandler(self.__cfh)
+        # The file handlers are run by background threads so that the main
+        # loop only has to put the log records into a queue
+        logQueue = Queue()
+        canLogQueue = Queue()
+        self.__logListeners = (
+            QueueListener(logQueue, self.__fh, respect_handler_level=True),
+            QueueListener(canLogQueue, self.__cfh, respect_handler_level=True))
+        for listener in self.__logListeners:
+            listener.start()
+        self.logger.addHandler(QueueHandler(logQueue))
+        self.canLogger.addHandler(QueueHandler(canLogQueue))
         self.canLogger.info(coc.MSGHEADER)
 
         # Intialize object dictionary
@@ -110,7 +142,19 @@ class CANopenDCSController(object):
         self.__channel = channel
         self.__bitrate = bitrate
         self.__nodeId = nodeId
+        self._buildDispatchTable()
         self.__toggleBit = False
+        # Number and positions of connected PSPPs per SCB, calculated on the
+        # first SYNC after the connections have changed
+        self.__connCache = None
+        # PDOs of the simulated PSPP read out which are sent one by one
+        self.__pendingPdos = deque()
+        self.__nextPdoTime = 0
+        # Received messages are passed from the reading thread to mainloop
+        self.__rxQueue = deque([], 1024)
+        self.__rxEvent = Event()
+        self.__pill2kill = Event()
+        self.__readThread = None
         self.__ch = canlib.openChannel(channel, canlib.canOPEN_ACCEPT_VIRTUAL)
         self.logger.success(str(self))
         self.__state = 127
@@ -130,12 +174,19 @@ class CANopenDCSController(object):
         if isinstance(exception_value, KeyboardInterrupt):
             self.logger.warning('Received Ctrl+C event (KeyboardInterrupt).')
         self.closeConnection()
+        # Write all remaining log records to the files
+        for listener in self.__logListeners:
+            listener.stop()
         logging.shutdown()
         if isinstance(exception_value, KeyboardInterrupt):
             return True
 
     def closeConnection(self):
         """Convenience function for closing a connection."""
+        self.__pill2kill.set()
+        if self.__readThread is not None:
+            self.__readThread.join()
+            self.__readThread = None
         self.__ch.busOff()
         self.__ch.close()
         self.logger.info('Connection closed')
@@ -173,6 +224,7 @@ class CANopenDCSController(object):
     @nodeId.setter
     def nodeId(self, nodeId):
         self.__nodeId = nodeId
+        self._buildDispatchTable()
         self.__allowedNodeIds = self.calcAllowedNodeIds(nodeId)
 
     @property
@@ -200,43 +252,100 @@ class CANopenDCSController(object):
         if (flag & canlib.canMSG_ERROR_FRAME != 0):
             self.logger.error("***ERROR FRAME RECEIVED***")
             self.canLogger.error("***ERROR FRAME RECEIVED***")
-        else:
-            msgstr = '{:3x} {:d}   '.format(cobid, dlc)
-            for i in range(len(msg)):
-                msgstr += '{:02x}  '.format(msg[i])
-            msgstr += '    ' * (8 - len(msg)) + \
-                str(timedelta(milliseconds=time))
-            self.logger.info(coc.MSGHEADER)
+        # Only build the message string if any of the loggers will use it
+        elif self.logger.isEnabledFor(logging.INFO) or \
+                self.canLogger.isEnabledFor(logging.INFO):
+            msgstr = (f'{cobid:3x} {dlc:d}   '
+                      + ''.join([f'{b:02x}  ' for b in msg])
+                      + '    ' * (8 - len(msg))
+                      + _formatTimestamp(time))
             self.logger.info(msgstr)
             self.canLogger.info(msgstr)
 
+    def _tryRead(self, timeout):
+        """Read a message from the bus
+
+        Parameters
+        ----------
+        timeout : :obj:`int`
+            Time in milliseconds to wait for a message
+
+        Returns
+        -------
+        :obj:`tuple` or :data:`None`
+            The message as returned by :meth:`canlib.canlib.Channel.read` or
+            :data:`None` if no message arrived within the timeout.
+        """
+        try:
+            return self.__ch.read(timeout)
+        except canlib.canNoMsg:
+            return None
+
+    def readMessages(self):
+        """Read incoming messages from the bus and store them in a queue for
+        :meth:`mainloop`.
+
+        This method loops until the :class:`~threading.Event` ``pill2kill`` is
+        set and is therefore designed to be used as a
+        :class:`~threading.Thread`. It does nothing but reading, so that the
+        receive buffer of the driver is drained independently of the time
+        needed to evaluate the messages. If the queue is full the oldest
+        messages are discarded.
+        """
+        try:
+            while not self.__pill2kill.is_set():
+                # The timeout allows checking pill2kill regularly
+                frame = self._tryRead(100)
+                if frame is None:
+                    continue
+                while frame is not None:
+                    self.__rxQueue.append(frame)
+                    frame = self._tryRead(0)
+                self.__rxEvent.set()
+        except (canlib.canError) as ex:
+            self.logger.exception(ex)
+            self.__pill2kill.set()
+            self.__rxEvent.set()
+
     def mainloop(self):
-        """Read incoming messages from the Bus and pass them to the evalation
-        function. Only aborts when a CAN error occurs.
+        """Pass incoming messages from the Bus to the evalation function. Only
+        aborts when a CAN error occurs.
+
+        The messages are read by :meth:`readMessages` in a separate thread
+        which is started here. Messages which arrive in a burst are evaluated
+        in one go.
         """
 
-        finished = False
         self.logger.debug('Entering main loop')
         self.logger.debug('This is a debug message!')
-        while not finished:
+        self.__pill2kill.clear()
+        self.__readThread = Thread(target=self.readMessages)
+        self.__readThread.start()
+        # Bind everything needed per message to local names to save the
+        # attribute lookups
+        rxQueue = self.__rxQueue
+        popleft = rxQueue.popleft
+        rxEvent = self.__rxEvent
+        dumpMessage = self.dumpMessage
+        evaluateMessage = self.evaluate_message
+        sendPendingPdo = self._sendPendingPdo
+        while not self.__pill2kill.is_set():
             try:
-                cobid, msg, dlc, flag, time = self.__ch.read(1000)
-                hasMessage = True
-                while hasMessage:
-                    self.dumpMessage(cobid, msg, dlc, flag, time)
-                    self.evaluate_message(cobid, msg, dlc, flag, time)
-                    try:
-                        cobid, msg, dlc, flag, time = self.__ch.read(1000)
-                    except(canlib.canNoMsg):
-                        hasMessage = False
-                    except (canlib.canError) as ex:
-                        self.logger.error(ex)
-                        finished = True
-            except(canlib.canNoMsg):
-                pass
+                if not rxEvent.wait(sendPendingPdo() / 1000):
+                    continue
+                rxEvent.clear()
+                if not rxQueue:
+                    continue
+                # Print the header once for every burst of messages
+                self.logger.info(coc.MSGHEADER)
+                while rxQueue:
+                    frame = popleft()
+                    dumpMessage(*frame)
+                    evaluateMessage(*frame)
+                    sendPendingPdo()
             except (canlib.canError) as ex:
                 self.logger.exception(ex)
-                finished = True
+                self.__pill2kill.set()
         self.logger.notice('Exiting main loop')
 
     def evaluate_message(self, cobid, msg, dlc, flag, time):
@@ -263,45 +372,84 @@ class CANopenDCSController(object):
         # Check for error frame
         if (flag & canlib.canMSG_ERROR_FRAME != 0):
             self.logger.error("***ERROR FRAME RECEIVED***")
-        # Check for NMT master command
-        elif cobid == 0 and msg[1] in [0, self.__nodeId]:
-            if msg[0] == 1:
-                self.logger.info('Received \'start_remote_node\' command')
-        # Check for SYNC message
-        elif cobid == 0x80 and len(msg) == 0 and \
-                (flag & canlib.canMSG_RTR == 0):
-            self.logger.info('Received SYNC message')
-            self.process_sync()
-        # Check for node guarding
-        elif cobid == 0x700 + self.__nodeId and \
-                (flag & canlib.canMSG_RTR != 0):
-            self.logger.info('Got node guarding message')
-            self.__toggleBit = not self.__toggleBit
-            self.__ch.write(0x700 + self.__nodeId,
+            return
+        handler = self.__dispatch.get(cobid)
+        # Other COB-IDs are ignored.
+        if handler is None or not handler(msg, flag):
+            self.logger.info('Got message which was not relevant for me')
+
+    def _buildDispatchTable(self):
+        """Map the COB-IDs relevant for this node to their handler methods
+
+        The table depends on the node id and is therefore rebuilt whenever it
+        changes. This way :meth:`evaluate_message` only needs one dictionary
+        lookup per message. All handlers take the CAN data and flags and
+        return :data:`True` if the message was relevant.
+
+        The node specific COB-IDs used for responses are calculated here as
+        well.
+        """
+        self.__nmtTargets = frozenset((0, self.__nodeId))
+        self.__nmtErrorCobid = coc.COBID.NMT_ERROR_CTRL.value + self.__nodeId
+        self.__tpdo1Cobid = coc.COBID.TPDO1.value + self.__nodeId
+        self.__sdoTxCobid = coc.COBID.SDO_TX.value + self.__nodeId
+        self.__dispatch = {
+            coc.COBID.NMT_MASTER.value: self._handleNmt,
+            0x80: self._handleSync,
+            self.__nmtErrorCobid: self._handleNodeGuarding,
+            self.__tpdo1Cobid: self._handleTpdo2Request,
+            coc.COBID.SDO_RX.value + self.__nodeId: self._handleSdoRequest}
+
+    def _handleNmt(self, msg, flag):
+        """Handle a NMT master command"""
+        if msg[1] not in self.__nmtTargets:
+            return False
+        if msg[0] == 1:
+            self.logger.info('Received \'start_remote_node\' command')
+        return True
+
+    def _handleSync(self, msg, flag):
+        """Handle a SYNC message"""
+        if len(msg) != 0 or (flag & canlib.canMSG_RTR != 0):
+            return False
+        self.logger.info('Received SYNC message')
+        self.process_sync()
+        return True
+
+    def _handleNodeGuarding(self, msg, flag):
+        """Answer a node guarding request"""
+        if flag & canlib.canMSG_RTR == 0:
+            return False
+        self.logger.info('Got node guarding message')
+        self.__toggleBit = not self.__toggleBit
+        self.__ch.write_raw(self.__nmtErrorCobid,
                             [(self.__toggleBit << 7) | self.__state])
-        # Check for TPDO2 request
-        elif cobid == 0x280 + self.__nodeId and \
-                (flag & canlib.canMSG_RTR != 0):
-            self.logger.info('Received RTR for TPDO2')
-        # Check for SDOtx request
-        elif (cobid == coc.COBID.SDO_RX.value + self.__nodeId) and \
-                ((msg[0] >> 5) == 2):
+        return True
+
+    def _handleTpdo2Request(self, msg, flag):
+        """Handle a RTR for TPDO2"""
+        if flag & canlib.canMSG_RTR == 0:
+            return False
+        self.logger.info('Received RTR for TPDO2')
+        return True
+
+    def _handleSdoRequest(self, msg, flag):
+        """Pass a SDO request to the processing method of its command
+        specifier"""
+        ccs = msg[0] >> 5
+        if ccs == 2:
             self.logger.info('Received a SDO read request')
             self.process_sdo_read(msg)
-        # Check for SDOrx request
-        elif (cobid == coc.COBID.SDO_RX.value + self.__nodeId) and \
-                ((msg[0] >> 5) == 1):
+        elif ccs == 1:
             self.logger.notice('Received a SDO write request')
             self.process_sdo_write(msg)
         # When it is not a valid request then the command specifier is invalid.
-        elif cobid == coc.COBID.SDO_RX.value + self.__nodeId:
+        else:
             self.logger.error('Unkown command specifier')
-            ret = self.sdo_abort_message([msg[2], msg[1]], msg[3],
+            ret = self.sdo_abort_message(msg[1:3], msg[3],
                                          SAC.COMMAND)
-            self.__ch.write(coc.COBID.SDO_TX.value, ret)
-        # Other COB-IDs are ignored.
-        else:
-            self.logger.info('Got message which was not relevant for me')
+            self.__ch.write_raw(coc.COBID.SDO_TX.value, ret)
+        return True
 
     def gather_value(self, index, subindex):
         """Simulate collecting a value from hardware or from OD
@@ -331,20 +479,20 @@ class CANopenDCSController(object):
                 if reg == 0: return 0x21
                 if reg == 1: return 0xF5
                 if reg not in [5, 6, 7, 10, 11, 12]:
-                    return rdm.randrange(PSPP_MAX_VALUES[reg])
+                    return rdm.getrandbits(PSPP_REGISTER_BITS[reg])
             # ADC channels
             if subindex in range(0x20, 0x28):
                 sleep(0.001)
-                return (subindex - 0x20) * 128 + rdm.randrange(64)
+                return (subindex - 0x20) * 128 + rdm.getrandbits(6)
             # Monitoring data
             if subindex == 1:
                 sleep(0.005)
-                t = (2**9 + rdm.randrange(2**5)) << 20
-                v1 = (2**9 + rdm.randrange(2**5)) << 10
-                v2 = 2**9 + rdm.randrange(2**5)
+                t = (2**9 + rdm.getrandbits(5)) << 20
+                v1 = (2**9 + rdm.getrandbits(5)) << 10
+                v2 = 2**9 + rdm.getrandbits(5)
                 return (1 << 31) | t | v1 | v2
         elif index == 0x2300 and subindex in range(1, 4):
-            return subindex * 8192 + rdm.randrange(256)
+            return subindex * 8192 + rdm.getrandbits(8)
         return self.__od[index][subindex].value
 
     def process_sdo_read(self, msg, timeout=42):
@@ -368,43 +516,42 @@ class CANopenDCSController(object):
         """
 
         # Initialize variables and parameters
-        index = int.from_bytes([msg[1], msg[2]], 'little')
-        idx = [0, 0]
-        idx[0], idx[1] = index.to_bytes(2, 'little')
+        idx = msg[1:3]
+        index = msg[1] | (msg[2] << 8)
         subindex = msg[3]
-        ret = [0 for i in range(coc.MAX_DATABYTES)]
-        cobid = coc.COBID.SDO_TX + self.__nodeId
+        ret = bytearray(coc.MAX_DATABYTES)
+        cobid = self.__sdoTxCobid
         ret[1], ret[2] = msg[1], msg[2]
         ret[3] = msg[3]
         # Check for SDO read request
         if msg[0] == 0x40:
+            od = self.__od
             # Check if object exists
-            if index not in self.__od or index == 0x2100:
+            if index not in od or index == 0x2100:
                 ret = self.sdo_abort_message(idx, subindex, SAC.NO_OBJECT)
-                self.__ch.writeWait(Frame(cobid, ret), timeout)
+                self.__ch.writeWait_raw(cobid, ret, timeout=timeout)
                 self.logger.error('Object for SDO transfer does not exist!')
                 return False
-            elif subindex not in self.__od[index]:
+            elif subindex not in od[index]:
                 ret = self.sdo_abort_message(idx, subindex, SAC.SUBINDEX)
-                self.__ch.writeWait(Frame(cobid, ret), timeout)
+                self.__ch.writeWait_raw(cobid, ret, timeout=timeout)
                 self.logger.error('Subindex for SDO transfer does not exist!')
                 return False
             try:
                 val = self.gather_value(index, subindex)
-                self.logger.info(f'Answering with value {val}.')
+                self.logger.info('Answering with value %s.', val)
             except ChipNotConnectedError:
                 ret = self.sdo_abort_message(idx, subindex, SAC.HARDWARE_ERROR)
-                self.__ch.writeWait(Frame(cobid, ret), timeout)
+                self.__ch.writeWait_raw(cobid, ret, timeout=timeout)
                 self.logger.error('The PSPP to read from is not connected!')
                 return False
             byteval, datasize = self.parse_val(val)
             # Expedited transfer
             if len(byteval) == 4:
                 self.logger.info('Using expedited transfer for response.')
-                ret[4], ret[5], ret[6], ret[7] = byteval
-                ret[0] = (((0b0100 << 2) | ((4 - datasize) & 0b11)) << 2) | \
-                    0b11
-                self.__ch.writeWait(Frame(cobid, ret), timeout)
+                ret[4:] = byteval
+                ret[0] = SDO_EXPEDITED_UPLOAD_COMMANDS[datasize]
+                self.__ch.writeWait_raw(cobid, ret, timeout=timeout)
                 return True
             # Segmented transfer
             else:
@@ -415,9 +562,9 @@ class CANopenDCSController(object):
             return False
         else:
             self.logger.error('Unknown SDO command specifier in initial '
-                              'request (0x{:02x})'.format(msg[0]))
+                              'request (0x%02x)', msg[0])
             ret = self.sdo_abort_message(idx, subindex, SAC.COMMAND)
-            self.__ch.writeWait(Frame(cobid, ret), timeout)
+            self.__ch.writeWait_raw(cobid, ret, timeout=timeout)
             return False
 
     def process_sdo_write(self, msg, timeout=42):
@@ -434,48 +581,50 @@ class CANopenDCSController(object):
         """
 
         cmd = msg[0]
-        index = int.from_bytes([msg[1], msg[2]], 'little')
+        idx = msg[1:3]
+        index = msg[1] | (msg[2] << 8)
         subindex = msg[3]
         n = (cmd >> 2) & 0b11
         datasize = 4 - n
         data = int.from_bytes(msg[4:(4 + datasize)], 'little')
-        cobid = coc.COBID.SDO_TX + self.__nodeId
-        ret = [0 for i in range(8)]
+        cobid = self.__sdoTxCobid
+        od = self.__od
+        entry = od[index] if index in od else None
         # Check if command specifier known
-        if cmd not in [0x23, 0x27, 0x2b, 0x2f]:
+        if cmd not in SDO_WRITE_COMMANDS:
             self.logger.error('Unkown command specifier')
-            ret = self.sdo_abort_message([msg[2], msg[1]], msg[3],
+            ret = self.sdo_abort_message(idx, subindex,
                                          SAC.COMMAND)
         # Check if object exists
-        elif index not in self.__od:
+        elif entry is None:
             self.logger.error('Object does not exist.')
-            ret = self.sdo_abort_message([msg[2], msg[1]], msg[3],
+            ret = self.sdo_abort_message(idx, subindex,
                                          SAC.NO_OBJECT)
         # Check if subindex exists
-        elif subindex not in self.__od[index]:
+        elif subindex not in entry:
             self.logger.error('Subindex does not exist.')
-            ret = self.sdo_abort_message([msg[2], msg[1]], msg[3],
+            ret = self.sdo_abort_message(idx, subindex,
                                          SAC.SUBINDEX)
         # Check access attribute
-        elif self.__od[index][subindex].attribute in [coc.ATTR.RO,
-                                                      coc.ATTR.CONST]:
+        elif entry[subindex].attribute in [coc.ATTR.RO, coc.ATTR.CONST]:
             self.logger.error('No write access')
-            ret = self.sdo_abort_message([msg[2], msg[1]], msg[3],
+            ret = self.sdo_abort_message(idx, subindex,
                                          SAC.ACCESS)
         else:
-            self.logger.notice(f'Writing value {data:X} on '
-                               f'{index:X}:{subindex:X}.')
-            self.__od[index][subindex].value = data
+            self.logger.notice('Writing value %X on %X:%X.', data, index,
+                               subindex)
+            entry[subindex].value = data
+            ret = bytearray(8)
             ret[0] = 0x60
             ret[1:4] = msg[1:4]
-            ret[4:] = [0 for i in range(4)]
             if index == 0x2000 and subindex in range(1, 5):
                 scb = subindex - 1
-                self.logger.notice(f'SCB{scb}: Setting connections.')
+                self.logger.notice('SCB%d: Setting connections.', scb)
+                self.__connCache = None
+                base = 0x2200 + scb * 16
                 for i in range(16):
-                    pspp_idx = 0x2200 + scb * 16 + i
-                    self.__od[pspp_idx][2].value = bool((data >> i) & 1)
-        self.__ch.writeWait(Frame(cobid, ret), timeout)
+                    od[base + i][2].value = bool((data >> i) & 1)
+        self.__ch.writeWait_raw(cobid, ret, timeout=timeout)
 
     def sdo_abort_message(self, index, subindex, abort_code):
         """Calculate message bytes for SDO error message
@@ -494,54 +643,80 @@ class CANopenDCSController(object):
 
         Returns
         -------
-        :obj:`list` of :obj:`int`
-            The message bytes as a list of integers
+        :obj:`bytearray`
+            The message bytes
         """
-        if isinstance(abort_code, SAC):
-            ac = abort_code.value.to_bytes(4, 'little')
-        elif isinstance(abort_code, int):
-            ac = abort_code.to_bytes(4, 'little')
-        else:
+        # This also covers sdoAbortCodes members which are integers as well
+        if not isinstance(abort_code, int):
             raise ValueError('Abort code has inappropiate type')
-        ret = [0 for i in range(8)]
+        ac = abort_code.to_bytes(4, 'little')
+        ret = bytearray(8)
         ret[0] = 0b10000000
-        ret[1], ret[2] = index[0], index[1]
+        ret[1:3] = index
         ret[3] = subindex
-        ret[4], ret[5], ret[6], ret[7] = ac
+        ret[4:] = ac
         return ret
 
     def process_sync(self):
         """React to a SYNC message
 
-        Simulate read out of PSPPs and send data as several PDOs.
+        Simulate read out of PSPPs and send data as several PDOs. The PDO of
+        the Controller is sent immediately while the PDOs of the PSPPs are
+        queued and sent by :meth:`mainloop` every 5 ms.
         """
 
         # Gather number and position connected chips
-        n_PSPP = [bin(x.value).count('1') for x in self.__od[0x2000][1:]]
-        p_PSPP = [[i for i in range(16) if format(x.value, '016b')[i] == '1']
-                  for x in self.__od[0x2000][1:]]
-        self.logger.debug('Number of connected PSPP per SCB: ' + str(n_PSPP))
-        self.logger.debug('Position of connected PSPP per SCB: ' + str(p_PSPP))
+        if self.__connCache is None:
+            # Position i corresponds to bit 15 - i of the 16 bit value
+            p_PSPP = [[i for i in range(16) if x.value >> (15 - i) & 1]
+                      for x in self.__od[0x2000][1:]]
+            n_PSPP = [len(p) for p in p_PSPP]
+            # First PDO byte of every connected PSPP
+            headers = [(scb << 4) | pos for scb in range(4)
+                       for pos in p_PSPP[scb]]
+            self.__connCache = n_PSPP, p_PSPP, headers
+        n_PSPP, p_PSPP, headers = self.__connCache
+        self.logger.debug('Number of connected PSPP per SCB: %s', n_PSPP)
+        self.logger.debug('Position of connected PSPP per SCB: %s', p_PSPP)
 
         # Initialize variables
-        cobid = coc.COBID.TPDO1.value + self.__nodeId
-        msg = [0 for i in range(6)]
+        cobid = self.__tpdo1Cobid
+        msg = bytearray(6)
 
         # Transmit monitoring values of the Controller
         self.logger.debug('Transmit monitoring values of Controller')
         msg[0] = 0x80
-        msg[1:5] = [rdm.randrange(256) for i in range(4)]
-        self.__ch.write(cobid, msg)
+        msg[1:5] = rdm.getrandbits(32).to_bytes(4, 'little')
+        self.__ch.write_raw(cobid, msg)
 
         # Transmit monitoring values of PSPPs
         self.logger.debug('Transmit monitoring values of PSPPs')
-        for scb in range(4):
-            for i in range(n_PSPP[scb]):
-                sleep(0.005)    # Simulate communication with hardware
-                msg[0] = (scb << 4) | p_PSPP[scb][i]
-                msg[1:] = (((1 << 38) | rdm.randrange(2**38)) <<
-                           1).to_bytes(5, 'little')
-                self.__ch.write(cobid, msg)
+        # The header byte and the 5 data bytes are built as one integer. The
+        # PDOs are sent from the main loop to simulate the communication with
+        # the hardware without blocking the reception of messages.
+        for header in headers:
+            val = (((1 << 38) | rdm.getrandbits(38)) << 9) | header
+            self.__pendingPdos.append((cobid, val.to_bytes(6, 'little')))
+
+    def _sendPendingPdo(self):
+        """Send the next queued PSPP PDO if the simulated read out time of
+        5 ms since the last one has passed
+
+        Returns
+        -------
+        :obj:`int`
+            Timeout in milliseconds for the next read from the bus so that the
+            next PDO is not delayed
+        """
+        if not self.__pendingPdos:
+            return 1000
+        now = monotonic()
+        if now >= self.__nextPdoTime:
+            self.__ch.write_raw(*self.__pendingPdos.popleft())
+            self.__nextPdoTime = now + 0.005
+            if not self.__pendingPdos:
+                return 1000
+        return int((self.__nextPdoTime - now) * 1000) + 1
 
     def parse_val(self, val):
         """Convert a value to a byte array.
@@ -562,19 +737,15 @@ class CANopenDCSController(object):
         :obj:`int`
             Data size
         """
-        ret = None
+        # Integers (and booleans) are by far the most common values
+        if isinstance(val, int):
+            dz = (val.bit_length() + 7) >> 3
+            return val.to_bytes(max(4, dz), 'little'), dz
         if isinstance(val, str):
-            dz = len(val)
-            ret = b''.join([bytearray(val, 'ascii'),
-                            bytearray(max(0, 4 - len(val)))])
-        elif isinstance(val, int):
-            vbl = val.bit_length()
-            dz = ceil(vbl / 8)
-            ret = val.to_bytes(max(4, dz), 'little')
-        else:
-            self.logger.error(f'No data types beside string and int supported!'
-                              f' Got: {val}')
-        return ret, dz
+            return val.encode('ascii').ljust(4, b'\x00'), len(val)
+        self.logger.error(f'No data types beside string and int supported!'
+                          f' Got: {val}')
+        return None, 0
 
 
 def main():
@@ -23,20 +23,23 @@ start it manually with the following command::
 import os
 import logging
 import re
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from queue import Queue
 # import random as rdm
 import time
+import struct
+import functools
 # from datetime import timedelta
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
 from collections import deque, Counter
-from threading import Thread, Event, Lock
+from threading import Thread, Event, Lock, BoundedSemaphore, Condition
 import ctypes as ct
 from configparser import ConfigParser
 
 # Third party modules
 import coloredlogs as cl
 import verboselogs
-from canlib import canlib, Frame
+from canlib import canlib
 from canlib.canlib.exceptions import CanGeneralError
 from opcua import Server, ua
 import analib
@@ -45,19 +48,119 @@ import analib
 try:
     from .objectDictionary import objectDictionary
     from . import CANopenConstants as coc
-    from .mirrorClasses import MyDCSController
-    from .extend_logging import extend_logging
+    from .mirrorClasses import MyDCSController, writeAttributes
+    from .extend_logging import extend_logging, SecondCachingFormatter
     from .__version__ import __version__
 except (ImportError, ModuleNotFoundError):
     from __version__ import __version__
     from objectDictionary import objectDictionary
     import CANopenConstants as coc
-    from mirrorClasses import MyDCSController
-    from extend_logging import extend_logging
+    from mirrorClasses import MyDCSController, writeAttributes
+    from extend_logging import extend_logging, SecondCachingFormatter
 
 
 scrdir = os.path.dirname(os.path.abspath(__file__))
 
+# Names of the log levels which can be chosen on the command line
+LOG_LEVELS = ('NOTSET', 'SPAM', 'DEBUG', 'VERBOSE', 'INFO', 'NOTICE',
+              'SUCCESS', 'WARNING', 'ERROR', 'CRITICAL')
+
+# If the global logging configuration has already been installed
+_loggingInstalled = False
+
+# Command bytes of SDO read responses (expedited uploads, segmented upload
+# initiation and abort)
+SDO_READ_RESPONSES = frozenset((0x80, 0x43, 0x47, 0x4b, 0x4f, 0x42))
+
+# Command bytes of SDO write responses (download confirmation and abort)
+SDO_WRITE_RESPONSES = frozenset((0x80, 0x60))
+
+# Receive timestamps of the AnaGate callback are only used for ordering, so
+# the monotonic clock is sufficient
+_monotonic = time.monotonic
+
+# Column formatted hex representation of every possible data byte
+HEX_BYTES = tuple(f'{b:02x}  ' for b in range(256))
+
+# Node names of the PSPP ADC channels
+CH_KEYS = tuple(f'Ch{ch}' for ch in range(8))
+
+# PSPP register names and numbers in a fixed order
+REGISTER_ITEMS = tuple(coc.PSPP_REGISTERS.items())
+
+# Subindices and SDO timeouts of the objects read from every PSPP in the main
+# loop: monitoring data, ADC channels and registers
+PSPP_READS = (((1, 3000),) + tuple((0x20 | ch, 1000) for ch in range(8)) +
+              tuple((0x10 | sub, 1000) for name, sub in REGISTER_ITEMS))
+
+# Maximum number of SDO read requests waiting for their response at the same
+# time
+SDO_MAX_OUTSTANDING = 8
+
+# Number of attempts for reading objects needed during start-up
+SDO_MAX_RETRIES = 5
+
+# Number of times a timed out SDO read of the main loop is repeated
+SDO_READ_RETRIES = 2
+
+# COB-IDs of SDO requests for every node id
+SDO_RX_COBIDS = tuple(coc.COBID.SDO_RX + nodeId for nodeId in range(128))
+
+# Command bytes of expedited SDO download requests by number of data bytes
+SDO_WRITE_COMMANDS = (None, 0x2F, 0x2B, 0x27, 0x23)
+
+# Layout of SDO upload requests: command byte, index, subindex and four
+# reserved zero bytes
+SDO_READ_REQUEST = struct.Struct('<BHB4x')
+
+# Layout of expedited SDO download requests: command byte, index, subindex
+# and four data bytes
+SDO_WRITE_REQUEST = struct.Struct('<BHBI')
+
+# Bit shifts and mask of the three 10 bit values in the PSPP monitoring data
+MON_SHIFTS = (0, 10, 20)
+MON_MASK = 0x3FF
+
+
+def decodeMonitoringData(monVals):
+    """Split the |PSPP| monitoring data into its three 10 bit values
+
+    Parameters
+    ----------
+    monVals : :obj:`int`
+        Raw monitoring data as read via |SDO|
+
+    Returns
+    -------
+    :obj:`tuple` of :obj:`int`
+        The values in the order of :data:`~CANopenConstants.PSPPMONVALS`
+    """
+    return ((monVals >> MON_SHIFTS[0]) & MON_MASK,
+            (monVals >> MON_SHIFTS[1]) & MON_MASK,
+            (monVals >> MON_SHIFTS[2]) & MON_MASK)
+
+
+def decodeConnectedPSPPs(val):
+    """Get the numbers of the connected |PSPP| chips from a bit mask
+
+    Parameters
+    ----------
+    val : :obj:`int`
+        Value of the `ConnectedPSPPs` |OD| attribute of one |SCB| master
+
+    Returns
+    -------
+    :obj:`list` of :obj:`int`
+        Numbers of the connected |PSPP| chips in ascending order
+    """
+    # Only iterate over the set bits, lowest first
+    pspps = []
+    val &= 0xFFFF
+    while val:
+        pspps.append((val & -val).bit_length() - 1)
+        val &= val - 1
+    return pspps
+
 
 class BusEmptyError(Exception):
     pass
@@ -144,10 +247,17 @@ class DCSControllerServer(object):
         self.__isinit = False
         self.ret = None
         self.__cnt = Counter()
-
-        # Initialize logger
-        extend_logging()
-        verboselogs.install()
+        self.__msgsSinceHeader = 0
+
+        # Initialize logger. The global logging configuration is only
+        # installed by the first instance.
+        global _loggingInstalled
+        if not _loggingInstalled:
+            extend_logging()
+            verboselogs.install()
+            cl.install(fmt=logformat, level=console_loglevel, isatty=True,
+                       milliseconds=True)
+            _loggingInstalled = True
         self.logger = logging.getLogger(__name__)
         """:obj:`~logging.Logger`: Main logger for this class"""
         self.logger.setLevel(logging.DEBUG)
@@ -159,18 +269,30 @@ class DCSControllerServer(object):
                           time.strftime('%Y-%m-%d_%H-%M-%S_OPCUA_Server.'))
         self.__fh = RotatingFileHandler(ts + 'log', backupCount=10,
                                         maxBytes=10 * 1024 * 1024)
-        fmt = logging.Formatter(logformat)
+        fmt = SecondCachingFormatter(logformat)
         fmt.default_msec_format = '%s.%03d'
         self.__fh.setFormatter(fmt)
-        cl.install(fmt=logformat, level=console_loglevel, isatty=True,
-                   milliseconds=True)
         self.__fh.setLevel(file_loglevel)
-        self.logger.addHandler(self.__fh)
         self.__fh_opcua = RotatingFileHandler(ts + 'opcua.log', backupCount=10,
                                               maxBytes=10 * 1024 * 1024)
         self.__fh_opcua.setFormatter(fmt)
         self.__fh_opcua.setLevel(file_loglevel)
-        self.opcua_logger.addHandler(self.__fh_opcua)
+        # The file handlers are run by background threads so that the CAN
+        # reading thread only has to put the log records into a queue
+        logQueue = Queue()
+        opcuaLogQueue = Queue()
+        self.__logListeners = (
+            QueueListener(logQueue, self.__fh, respect_handler_level=True),
+            QueueListener(opcuaLogQueue, self.__fh_opcua,
+                          respect_handler_level=True))
+        for listener in self.__logListeners:
+            listener.start()
+        # The loggers are shared by all instances, so the handlers are kept
+        # to remove them again in stop()
+        self.__logHandlers = ((self.logger, QueueHandler(logQueue)),
+                              (self.opcua_logger, QueueHandler(opcuaLogQueue)))
+        for logger, handler in self.__logHandlers:
+            logger.addHandler(handler)
         self.logger.info(f'Existing logging Handler: {self.logger.handlers}')
 
         # Initialize default arguments
@@ -180,6 +302,12 @@ class DCSControllerServer(object):
             raise ValueError(f'Possible CAN interfaces are "Kvaser" or '
                              f'"AnaGate" and not "{interface}".')
         self.__interface = interface
+        # Bind the writing function of the used interface so that it does not
+        # have to be selected on every call
+        if interface == 'Kvaser':
+            self.writeMessage = self._writeMessageKvaser
+        else:
+            self.writeMessage = self._writeMessageAnaGate
         if bitrate is None:
             bitrate = 125000
         bitrate = self._parseBitRate(bitrate)
@@ -225,9 +353,22 @@ class DCSControllerServer(object):
         """:obj:`int` : Internal attribute for the bit rate"""
         self.__ch = None
         """Internal attribute for the |CAN| channel"""
+        self.__chDeviceName = None
+        self.__chCardUpc = None
+        # Everything used by the receiving side has to exist before the
+        # AnaGate callback is registered
+        self.__canMsgQueue = deque([], 10)
+        self.__pill2kill = Event()
+        self.__cond = Condition()
+        self.__kvaserLock = Lock()
+        self.__sdoPending = {}
+        self.__sdoWritePending = {}
+        self.__sdoLock = Lock()
+        self.__sdoSlots = BoundedSemaphore(SDO_MAX_OUTSTANDING)
         if interface == 'Kvaser':
             self.__ch = canlib.openChannel(channel,
                                            canlib.canOPEN_ACCEPT_VIRTUAL)
+            self._cacheChannelData()
             self.__ch.setBusParams(self.__bitrate)
             self.logger.notice('Going in \'Bus On\' state ...')
             self.__ch.busOn()
@@ -238,11 +379,6 @@ class DCSControllerServer(object):
             self.__ch.setCallback(self.__cbFunc)
         self.logger.success(str(self))
         self.__busOn = True
-        self.__canMsgQueue = deque([], 10)
-        self.__pill2kill = Event()
-        self.__lock = Lock()
-        self.__kvaserLock = Lock()
-
 
         # Get DCS Controller OPC UA Object Type
         self.logger.notice('Get OPC UA Object Type of DCS Controller ...')
@@ -282,6 +418,8 @@ class DCSControllerServer(object):
         # Set connected PSPPs by reading configuration file
         self.logger.notice('Read configuration file ...')
         self.__connectedPSPPs = {}
+        self.__psppCache = {}
+        self.__psppCacheVersion = 0
         cf = ConfigParser()
         if config is None:
             config = os.path.join(scrdir, 'DCSControllerConfig.ini')
@@ -319,10 +457,8 @@ class DCSControllerServer(object):
 
     def __str__(self):
         if self.__interface == 'Kvaser':
-            chdataname = canlib.ChannelData(self.__channel).device_name
-            chdata_EAN = canlib.ChannelData(self.__channel).card_upc_no
-            return f'Using {chdataname}, EAN: {chdata_EAN}, Port: ' \
-                f'{self.endpoint}.'
+            return f'Using {self.__chDeviceName}, EAN: {self.__chCardUpc}, ' \
+                f'Port: {self.endpoint}.'
         else:
             return f'{self.__ch}'
 
@@ -416,11 +552,15 @@ class DCSControllerServer(object):
         :class:`~threading.Lock` object :attr:`lock` should be acquired before
         accessing it.
 
-        The queue is initialized with a maxmimum length of ``1000`` elements
-        to avoid memory problems although it is not expected to grow at all.
+        The queue is initialized with a maxmimum length of ``10`` elements so
+        that unconsumed messages are discarded and scanning it stays cheap.
 
         This special class is used instead of the :class:`queue.Queue` class
-        because it is iterable and fast."""
+        because it is iterable and fast.
+
+        Responses to pending |SDO| requests are handed directly to
+        :meth:`sdoRead` and :meth:`sdoWrite` and do not appear in this
+        queue."""
         return self.__canMsgQueue
 
     @property
@@ -433,15 +573,17 @@ class DCSControllerServer(object):
 
     @property
     def lock(self):
-        """:class:`~threading.Lock` : Lock object for accessing the incoming
-        message queue :attr:`canMsgQueue`"""
-        return self.__lock
+        """:class:`~threading.Condition` : Lock object for accessing the
+        incoming message queue :attr:`canMsgQueue`. It is notified whenever a
+        message is added to the queue."""
+        return self.__cond
 
     @property
     def kvaserLock(self):
         """:class:`~threading.Lock` : Lock object which should be acquired for
-        performing read or write operations on the Kvaser |CAN| channel. It
-        turned out that bad things can happen if that is not done."""
+        performing write operations on the Kvaser |CAN| channel. It turned
+        out that bad things can happen if concurrent writes are not
+        serialized. The reading thread does not acquire it."""
         return self.__kvaserLock
 
     @property
@@ -470,6 +612,14 @@ class DCSControllerServer(object):
         milliseconds"""
         return self.__period
 
+    def _cacheChannelData(self):
+        """Store device name and EAN of the Kvaser |CAN| channel so that they
+        do not have to be queried from the driver for every string
+        representation of this class."""
+        chdata = canlib.ChannelData(self.__channel)
+        self.__chDeviceName = chdata.device_name
+        self.__chCardUpc = chdata.card_upc_no
+
     def _parseBitRate(self, bitrate):
         if self.__interface == 'Kvaser':
             if bitrate not in coc.CANLIB_BITRATES:
@@ -507,6 +657,7 @@ class DCSControllerServer(object):
                     self.__ch = \
                         canlib.openChannel(self.__channel,
                                            canlib.canOPEN_ACCEPT_VIRTUAL)
+                    self._cacheChannelData()
                     self.logger.info(str(self))
                     self.__ch.setBusParams(self.__bitrate)
                     if not self.__busOn:
@@ -600,80 +751,116 @@ class DCSControllerServer(object):
         except AttributeError:
             pass
         self.__isserver = False
+        self._stopLogging()
+
+    def _stopLogging(self):
+        """Detach the queue handlers of this instance from the shared loggers
+        and write all remaining log records to the files
+
+        It is safe to call this method more than once.
+        """
+        for logger, handler in self.__logHandlers:
+            logger.removeHandler(handler)
+        self.__logHandlers = ()
+        for listener in self.__logListeners:
+            listener.stop()
+        self.__logListeners = ()
+        self.__fh.close()
+        self.__fh_opcua.close()
 
     def run(self):
         """Start actual CANopen communication
 
         This function contains an endless loop in which it is looped over all
         connected |DCS| Controllers and |PSPP| chips. Each value is read using
-        :meth:`sdoRead` and written to its corresponding |OPCUA| node if the
-        SDO read protocol was succesful.
+        :meth:`sdoRead` or :meth:`sdoReadMany` and written to its
+        corresponding |OPCUA| node if the SDO read protocol was succesful.
         """
 
+        # Bind frequently used attributes to local names
+        sdoRead = self.sdoRead
+        sdoReadMany = self.sdoReadMany
+        mypyDCs = self.__mypyDCs
+        nPsppReads = len(PSPP_READS)
         count = 0
         while True:
             count = 0 if count == 10 else count
+            nodeIds = self.__nodeIds
+            # Read ADC trimming bits of all nodes at once
+            adctrims = sdoReadMany([(nodeId, 0x2001, 0, 1000)
+                                    for nodeId in nodeIds], SDO_READ_RETRIES)
+            # The requests for monitoring data, ADC channels and registers of
+            # all PSPPs are sent in one burst. Only the requests to different
+            # nodes overlap.
+            pspps = []
+            requests = []
             # Loop over all connected CAN nodeIds
-            for nodeId in self.__nodeIds:
-                # Read ADC trimming bits
-                adctrim_n = self.sdoRead(nodeId, 0x2001, 0, 1000)
-                adctrim_o = self.mypyDCs[nodeId].ADCTRIM
+            for nodeId, adctrim_n in zip(nodeIds, adctrims):
+                dcs = mypyDCs[nodeId]
+                adctrim_o = dcs.ADCTRIM
                 if adctrim_n != adctrim_o:
                     self.logger.warning(f'ADC trimming bits of node {nodeId} '
                                         f'unexpectedly changed from '
                                         f'{adctrim_o} to {adctrim_n}.')
-                    self.mypyDCs[nodeId].ADCTRIM = adctrim_n
-                    self.mypyDCs[nodeId].write('ADCTRIM')
+                    dcs.ADCTRIM = adctrim_n
+                    dcs.write('ADCTRIM')
                 # Loop over all SCB masters
                 for scb in range(4):
                     # Reread connected PSPPs in case the user has changed it
-                    # val = self.mypyDCs[nodeId][scb].ConnectedPSPPs
+                    # val = dcs[scb].ConnectedPSPPs
                     # self.__connectedPSPPs[nodeId][scb] = \
-                    #     [i for i in range(16) if int(f'{val:016b}'[::-1][i])]
+                    #     decodeConnectedPSPPs(val)
                     # Loop over all possible PSPPs
                     for pspp in self.__connectedPSPPs[nodeId][scb]:
-                        PSPP = self.mypyDCs[nodeId][scb][pspp]
+                        pspps.append(dcs[scb][pspp])
                         index = 0x2200 | (scb << 4) | pspp
-                        # Loop over PSPP monitoring data
-                        monVals = self.sdoRead(nodeId, index, 1, 3000)
-                        if monVals is not None:
-                            vals = [(monVals >> i * 10) & (2**10 - 1)
-                                    for i in range(3)]
-                            for v, name in zip(vals, coc.PSPPMONVALS):
-                                PSPP.MonitoringData[name] = v
-                                PSPP.MonitoringData.write(name)
-                        # Read less often than monitoring values
-                        if True:
-                            # val = bool(self.sdoRead(nodeId, index, 2, 1000))
-                            PSPP.Status = True
-                            PSPP.write('Status')
-                            # Loop over ADC channels
-                            for ch in range(8):
-                                val = self.sdoRead(nodeId, index, 0x20 | ch,
-                                                   1000)
-                                if val is not None:
-                                    PSPP.ADCChannels[ch] = val
-                                    PSPP.ADCChannels.write(f'Ch{ch}')
-                            # Loop over registers
-                            for name in coc.PSPP_REGISTERS:
-                                val = self.sdoRead(nodeId, index, 0x10 |
-                                                   coc.PSPP_REGISTERS[name],
-                                                   1000)
-                                if val is not None:
-                                    PSPP.Regs[name] = val
-                                    PSPP.Regs.write(name)
+                        requests += [(nodeId, index, sub, timeout)
+                                     for sub, timeout in PSPP_READS]
+            results = sdoReadMany(requests, SDO_READ_RETRIES)
+            for i, PSPP in enumerate(pspps):
+                monVals, *vals = results[i * nPsppReads:(i + 1) * nPsppReads]
+                # Loop over PSPP monitoring data
+                # The values of each folder are written to the OPC UA nodes in
+                # one request
+                if monVals is not None:
+                    monData = PSPP.MonitoringData
+                    for v, name in zip(decodeMonitoringData(monVals),
+                                       coc.PSPPMONVALS):
+                        monData[name] = v
+                    monData.writeMany(coc.PSPPMONVALS)
+                # val = bool(sdoRead(nodeId, index, 2, 1000))
+                PSPP.Status = True
+                PSPP.write('Status')
+                # Loop over ADC channels
+                adcChannels = PSPP.ADCChannels
+                written = []
+                for ch, key, val in zip(range(8), CH_KEYS, vals):
+                    if val is not None:
+                        adcChannels[ch] = val
+                        written.append(key)
+                adcChannels.writeMany(written)
+                # Loop over registers
+                regs = PSPP.Regs
+                written = []
+                for (name, sub), val in zip(REGISTER_ITEMS, vals[8:]):
+                    if val is not None:
+                        regs[name] = val
+                        written.append(name)
+                regs.writeMany(written)
+            for nodeId in nodeIds:
+                frontends = mypyDCs[nodeId].Frontends
                 # Read module temperatures
                 for i in self.__MODTEMPCONN[nodeId]:
-                    val = self.sdoRead(nodeId, 0x2200 | i, 0, 1000)
+                    val = sdoRead(nodeId, 0x2200 | i, 0, 1000)
                     if val is not None:
-                        self.mypyDCs[nodeId].Frontends[i].Temperature = val
-                        self.mypyDCs[nodeId].Frontends[i].write('Temperature')
+                        frontends[i].Temperature = val
+                        frontends[i].write('Temperature')
                 # Read module voltages
                 for i in self.__MODVOLTCONN[nodeId]:
-                    val = self.sdoRead(nodeId, 0x2200 | i, 1, 1000)
+                    val = sdoRead(nodeId, 0x2200 | i, 1, 1000)
                     if val is not None:
-                        self.mypyDCs[nodeId].Frontends[i].Voltage = val
-                        self.mypyDCs[nodeId].Frontends[i].write('Voltage')
+                        frontends[i].Voltage = val
+                        frontends[i].write('Voltage')
             count += 1
 
     def readCanMessages(self):
@@ -688,8 +875,11 @@ class DCSControllerServer(object):
         while not self.__pill2kill.is_set():
             try:
                 if self.__interface == 'Kvaser':
-                    with self.__kvaserLock:
-                        frame = self.__ch.read()
+                    # Block in the driver for a short time instead of polling.
+                    # The read is not guarded by the Kvaser lock because
+                    # reading and writing the same handle concurrently is
+                    # safe; only writes have to be serialized.
+                    frame = self.__ch.read(timeout=50)
                     cobid, data, dlc, flag, t = (frame.id, frame.data,
                                                  frame.dlc, frame.flags,
                                                  frame.timestamp)
@@ -697,8 +887,11 @@ class DCSControllerServer(object):
                         raise canlib.CanNoMsg
                 else:
                     cobid, data, dlc, flag, t = self.__ch.getMessage()
-                with self.__lock:
-                    self.__canMsgQueue.appendleft((cobid, data, dlc, flag, t))
+                if not self._dispatchSdoResponse(cobid, data, dlc):
+                    with self.__cond:
+                        self.__canMsgQueue.appendleft((cobid, data, dlc, flag,
+                                                       t))
+                        self.__cond.notify_all()
                 self.dumpMessage(cobid, data, dlc, flag)
             except (canlib.CanNoMsg, analib.CanNoMsg):
                 pass
@@ -740,13 +933,168 @@ class DCSControllerServer(object):
                 class to work.
             """
             data = ct.string_at(data, dlc)
-            t = time.time()
-            with self.__lock:
-                self.__canMsgQueue.appendleft((cobid, data, dlc, flag, t))
+            if not self._dispatchSdoResponse(cobid, data, dlc):
+                t = _monotonic()
+                with self.__cond:
+                    self.__canMsgQueue.appendleft((cobid, data, dlc, flag, t))
+                    self.__cond.notify_all()
             self.dumpMessage(cobid, data, dlc, flag)
 
         return cbFunc
 
+    def _dispatchSdoResponse(self, cobid, data, dlc):
+        """Hand an |SDO| response over to a waiting :meth:`sdoRead` or
+        :meth:`sdoWrite` call
+
+        The pending requests are looked up by node id, index and subindex.
+        Requests for the same object are served in the order they were
+        registered. If a matching request is found the message is stored in
+        its result slot and its :class:`~threading.Event` is set. Abort
+        messages are given to a pending read request first.
+
+        Parameters
+        ----------
+        cobid : :obj:`int`
+            |CAN| identifier
+        data : :obj:`bytes`
+            |CAN| data - max length 8
+        dlc : :obj:`int`
+            Data Length Code
+
+        Returns
+        -------
+        :obj:`bool`
+            If the message was consumed by a pending |SDO| request
+        """
+        if dlc != 8:
+            return False
+        cmd = data[0]
+        isRead = cmd in SDO_READ_RESPONSES
+        isWrite = cmd in SDO_WRITE_RESPONSES
+        if not (isRead or isWrite):
+            return False
+        key = (cobid - coc.COBID.SDO_TX, data[1] | (data[2] << 8), data[3])
+        with self.__sdoLock:
+            pending = None
+            if isRead:
+                pending = self._popSdoRequest(self.__sdoPending, key)
+            if pending is None and isWrite:
+                pending = self._popSdoRequest(self.__sdoWritePending, key)
+            if pending is None:
+                return False
+            ev, slot = pending
+            slot.append(data)
+            ev.set()
+        return True
+
+    @staticmethod
+    def _popSdoRequest(pending, key):
+        """Remove the oldest request registered for an object
+
+        Must be called with the |SDO| lock held.
+
+        Parameters
+        ----------
+        pending : :obj:`dict`
+            Table of pending requests
+        key : :obj:`tuple` of :obj:`int`
+            Node id, index and subindex of the request
+
+        Returns
+        -------
+        :obj:`tuple`
+            Event and result slot of the request
+        :data:`None`
+            If no request is registered for `key`
+        """
+        queue = pending.get(key)
+        if not queue:
+            return None
+        request = queue.popleft()
+        if not queue:
+            del pending[key]
+        return request
+
+    def _registerSdoRequest(self, pending, key, ev, slot):
+        """Register an |SDO| request so that its response is handed over by
+        :meth:`_dispatchSdoResponse`
+
+        Parameters
+        ----------
+        pending : :obj:`dict`
+            Table of pending requests
+        key : :obj:`tuple` of :obj:`int`
+            Node id, index and subindex of the request
+        ev : :class:`~threading.Event`
+            Event which is set when the response arrives
+        slot : :obj:`list`
+            Result slot for the response
+        """
+        with self.__sdoLock:
+            pending.setdefault(key, deque()).append((ev, slot))
+
+    def _unregisterSdoRequest(self, pending, key, ev):
+        """Remove a request registered by :meth:`_registerSdoRequest`
+
+        Only the request belonging to `ev` is removed, other requests for the
+        same object are kept.
+
+        Parameters
+        ----------
+        pending : :obj:`dict`
+            Table of pending requests
+        key : :obj:`tuple` of :obj:`int`
+            Node id, index and subindex of the request
+        ev : :class:`~threading.Event`
+            Event of the request
+
+        Returns
+        -------
+        :obj:`bool`
+            If the request was still pending. :data:`False` means that its
+            response has already been stored in its result slot.
+        """
+        with self.__sdoLock:
+            queue = pending.get(key, ())
+            for request in queue:
+                if request[0] is ev:
+                    queue.remove(request)
+                    if not queue:
+                        del pending[key]
+                    return True
+        return False
+
+    def _waitSdoResponse(self, pending, key, ev, slot, timeout):
+        """Block until the response to a registered |SDO| request arrives
+
+        Parameters
+        ----------
+        pending : :obj:`dict`
+            Table of pending requests the request was registered in
+        key : :obj:`tuple` of :obj:`int`
+            Node id, index and subindex of the request
+        ev : :class:`~threading.Event`
+            Event which is set by :meth:`_dispatchSdoResponse`
+        slot : :obj:`list`
+            Result slot filled by :meth:`_dispatchSdoResponse`
+        timeout : :obj:`int`
+            |SDO| timeout in milliseconds
+
+        Returns
+        -------
+        :obj:`bytes`
+            The response message
+        :data:`None`
+            If no response arrived in time. The request is removed from
+            `pending` in this case.
+        """
+        # The response may arrive after the wait timed out, then the request
+        # is no longer pending and its slot is filled
+        if not ev.wait(timeout / 1000) and \
+                self._unregisterSdoRequest(pending, key, ev):
+            return None
+        return slot[0]
+
     def dumpMessage(self, cobid, msg, dlc, flag):
         """Dumps a CANopen message to the screen and log file
 
@@ -765,12 +1113,16 @@ class DCSControllerServer(object):
 
         if (flag & canlib.canMSG_ERROR_FRAME != 0):
             self.logger.error("***ERROR FRAME RECEIVED***")
-        else:
-            msgstr = '{:3X} {:d}   '.format(cobid, dlc)
-            for i in range(len(msg)):
-                msgstr += '{:02x}  '.format(msg[i])
-            msgstr += '    ' * (8 - len(msg))
-            self.logger.info(coc.MSGHEADER)
+        # Only build the message string if it is going to be logged
+        elif self.logger.isEnabledFor(logging.INFO):
+            msgstr = (f'{cobid:3X} {dlc:d}   '
+                      + ''.join(map(HEX_BYTES.__getitem__, msg))
+                      + '    ' * (8 - len(msg)))
+            # Repeat the column header only every 50 messages. It is put in
+            # the same log record as the message.
+            if self.__msgsSinceHeader == 0:
+                msgstr = coc.MSGHEADER + '\n' + msgstr
+            self.__msgsSinceHeader = (self.__msgsSinceHeader + 1) % 50
             self.logger.info(msgstr)
 
     def writeMessage(self, cobid, msg, flag=0, timeout=None):
@@ -787,14 +1139,29 @@ class DCSControllerServer(object):
         timeout : :obj:`int`, optional
             |SDO| write timeout in milliseconds. When :data:`None` or not
             given an infinit timeout is used.
+
+        Notes
+        -----
+        On instances this method is replaced by the implementation for the
+        used interface, :meth:`_writeMessageKvaser` or
+        :meth:`_writeMessageAnaGate`.
         """
         if self.__interface == 'Kvaser':
-            if timeout is None:
-                timeout = 0xFFFFFFFF
-            with self.__kvaserLock:
-                self.__ch.writeWait(Frame(cobid, msg), timeout)
+            self._writeMessageKvaser(cobid, msg, flag, timeout)
         else:
-            self.__ch.write(cobid, msg, flag)
+            self._writeMessageAnaGate(cobid, msg, flag, timeout)
+
+    def _writeMessageKvaser(self, cobid, msg, flag=0, timeout=None):
+        """Implementation of :meth:`writeMessage` for Kvaser interfaces"""
+        if timeout is None:
+            timeout = 0xFFFFFFFF
+        # Pass the raw data so that no Frame object has to be created
+        with self.__kvaserLock:
+            self.__ch.writeWait_raw(cobid, msg, flag, timeout=timeout)
+
+    def _writeMessageAnaGate(self, cobid, msg, flag=0, timeout=None):
+        """Implementation of :meth:`writeMessage` for AnaGate interfaces"""
+        self.__ch.write(cobid, msg, flag)
 
     def sdoRead(self, nodeId, index, subindex, timeout=100):
         """Read an object via |SDO|
@@ -820,45 +1187,149 @@ class DCSControllerServer(object):
         :data:`None`
             In case of errors
         """
+        return self.sdoAwait(self.sdoReadAsync(nodeId, index, subindex,
+                                               timeout), timeout)
+
+    def sdoReadAsync(self, nodeId, index, subindex, timeout=100):
+        """Send an |SDO| read request without waiting for the response
+
+        The response is collected with :meth:`sdoAwait` which has to be called
+        for every request returned by this method. At most
+        :data:`SDO_MAX_OUTSTANDING` requests may be pending at the same time;
+        further calls block until a slot is freed by :meth:`sdoAwait`.
+
+        Parameters
+        ----------
+        nodeId : :obj:`int`
+            The id from the node to read from
+        index : :obj:`int`
+            The Object Dictionary index to read from
+        subindex : :obj:`int`
+            |OD| Subindex. Defaults to zero for single value entries.
+        timeout : :obj:`int`, optional
+            Timeout for sending the request in milliseconds
+
+        Returns
+        -------
+        :obj:`tuple`
+            Handle of the pending request which is passed to :meth:`sdoAwait`
+        :data:`None`
+            If the request could not be sent
+        """
+        self.__sdoSlots.acquire()
+        return self._sdoSendRead(nodeId, index, subindex, timeout)
+
+    def _sdoSendRead(self, nodeId, index, subindex, timeout):
+        """Send an |SDO| read request for which a slot has already been
+        acquired
+
+        The slot is released again if the request could not be sent,
+        otherwise it is released by :meth:`sdoAwait`. Parameters and return
+        values are the same as for :meth:`sdoReadAsync`.
+        """
         if nodeId is None or index is None or subindex is None:
+            self.__sdoSlots.release()
             self.logger.warning('SDO read protocol cancelled before it could '
                                 'begin.')
             return None
         self.cnt['SDO read total'] += 1
-        self.logger.info(f'Send SDO read request to node {nodeId}.')
-        cobid = coc.COBID.SDO_RX + nodeId
-        msg = [0 for i in range(coc.MAX_DATABYTES)]
-        msg[1], msg[2] = index.to_bytes(2, 'little')
-        msg[3] = subindex
-        msg[0] = 0x40
+        self.logger.info('Send SDO read request to node %d.', nodeId)
+        cobid = SDO_RX_COBIDS[nodeId]
+        msg = SDO_READ_REQUEST.pack(0x40, index, subindex)
+        # Register the request before sending it so that the response can not
+        # be missed by the reading thread
+        request = ((nodeId, index, subindex), Event(), [])
+        self._registerSdoRequest(self.__sdoPending, *request)
+        sent = False
         try:
             self.writeMessage(cobid, msg, timeout=timeout)
+            sent = True
         except CanGeneralError:
             self.cnt['SDO read request timeout'] += 1
+        except analib.exception.DllException as ex:
+            self.logger.exception(ex)
+            self.cnt['SDO read request timeout'] += 1
+        finally:
+            # Do not leak the slot and the pending entry on any error
+            if not sent:
+                self._unregisterSdoRequest(self.__sdoPending, *request[:2])
+                self.__sdoSlots.release()
+        return request if sent else None
+
+    def sdoAwait(self, request, timeout=100):
+        """Wait for the response to a request sent by :meth:`sdoReadAsync`
+
+        Parameters
+        ----------
+        request : :obj:`tuple`
+            Handle returned by :meth:`sdoReadAsync`. If it is :data:`None`
+            nothing is done.
+        timeout : :obj:`int`, optional
+            |SDO| timeout in milliseconds
+
+        Returns
+        -------
+        :obj:`int`
+            The data if was successfully read
+        :data:`None`
+            In case of errors
+        """
+        if request is None:
             return None
-        # Wait for response
-        t0 = time.perf_counter()
-        messageValid = False
-        while time.perf_counter() - t0 < timeout / 1000:
-            with self.__lock:
-                for i, (cobid_ret, ret, dlc, flag, t) in \
-                        zip(range(len(self.__canMsgQueue)),
-                            self.__canMsgQueue):
-                    messageValid = \
-                        (dlc == 8 and cobid_ret == coc.COBID.SDO_TX + nodeId
-                         and ret[0] in [0x80, 0x43, 0x47, 0x4b, 0x4f, 0x42] and
-                         int.from_bytes([ret[1], ret[2]], 'little') == index
-                         and ret[3] == subindex)
-                    if messageValid:
-                        del self.__canMsgQueue[i]
-                        break
-            if messageValid:
-                break
-        else:
-            self.logger.info(f'SDO read response timeout (node {nodeId}, index'
-                             f' {index:04X}:{subindex:02X})')
+        return self._sdoDecodeRead(request[0],
+                                   self._sdoAwaitResponse(request, timeout))
+
+    def _sdoAwaitResponse(self, request, timeout):
+        """Wait for the raw response to a request sent by
+        :meth:`sdoReadAsync` and release its slot
+
+        Parameters
+        ----------
+        request : :obj:`tuple`
+            Handle returned by :meth:`sdoReadAsync`. Must not be
+            :data:`None`.
+        timeout : :obj:`int`
+            |SDO| timeout in milliseconds
+
+        Returns
+        -------
+        :obj:`bytes`
+            The response message
+        :data:`None`
+            If no response arrived in time
+        """
+        key, ev, slot = request
+        try:
+            ret = self._waitSdoResponse(self.__sdoPending, key, ev, slot,
+                                        timeout)
+        finally:
+            self.__sdoSlots.release()
+        if ret is None:
+            self.logger.info('SDO read response timeout (node %d, index '
+                             '%04X:%02X)', *key)
             self.cnt['SDO read response timeout'] += 1
+        return ret
+
+    def _sdoDecodeRead(self, key, ret):
+        """Decode the response to an |SDO| read request
+
+        Parameters
+        ----------
+        key : :obj:`tuple` of :obj:`int`
+            Node id, index and subindex of the request
+        ret : :obj:`bytes`
+            The response message or :data:`None` if there was none
+
+        Returns
+        -------
+        :obj:`int`
+            The data if was successfully read
+        :data:`None`
+            In case of errors
+        """
+        if ret is None:
             return None
+        nodeId, index, subindex = key
         # Check command byte
         if ret[0] == 0x80:
             abort_code = int.from_bytes(ret[4:], 'little')
@@ -868,12 +1339,90 @@ class DCSControllerServer(object):
             self.cnt['SDO read abort'] += 1
             return None
         nDatabytes = 4 - ((ret[0] >> 2) & 0b11) if ret[0] != 0x42 else 4
-        data = []
-        for i in range(nDatabytes):
-            data.append(ret[4 + i])
-        self.logger.info(f'Got data: {data}')
+        data = ret[4:4 + nDatabytes]
+        self.logger.info('Got data: %s', data.hex())
         return int.from_bytes(data, 'little')
 
+    def sdoReadMany(self, requests, retries=0):
+        """Read several objects via |SDO| with overlapping requests
+
+        A node serves only one |SDO| transfer at a time, so at most one
+        request per node id is in flight. The round trips of requests to
+        different nodes overlap, with up to :data:`SDO_MAX_OUTSTANDING`
+        requests in flight. Requests to the same node are sent in the order
+        of `requests`. While requests of this call are in flight it never
+        blocks for a free slot but awaits its own oldest request instead, so
+        concurrent callers can not deadlock each other.
+
+        Parameters
+        ----------
+        requests : :obj:`list` of :obj:`tuple`
+            Each entry is a tuple of node id, index, subindex and |SDO|
+            timeout in milliseconds as accepted by :meth:`sdoRead`.
+        retries : :obj:`int`, optional
+            How often a request is repeated if its response timed out.
+            Defaults to no repetition.
+
+        Returns
+        -------
+        :obj:`list`
+            The results of :meth:`sdoAwait` in the order of `requests`
+        """
+        # Bind frequently used attributes to local names
+        acquire = self.__sdoSlots.acquire
+        sdoSendRead = self._sdoSendRead
+        awaitResponse = self._sdoAwaitResponse
+        decodeRead = self._sdoDecodeRead
+        results = [None] * len(requests)
+        # Positions and remaining retries of the requests which are not sent
+        # yet, per node id
+        waiting = {}
+        ready = deque()
+        for i, request in enumerate(requests):
+            if request[0] not in waiting:
+                waiting[request[0]] = deque()
+                ready.append(request[0])
+            waiting[request[0]].append((i, retries))
+        # Node ids in ready have no request in flight
+        inFlight = deque()
+        try:
+            while ready or inFlight:
+                if ready and acquire(blocking=not inFlight):
+                    nodeId = ready.popleft()
+                    i, left = waiting[nodeId].popleft()
+                    index, subindex, timeout = requests[i][1:]
+                    inFlight.append((i, left, sdoSendRead(nodeId, index,
+                                                          subindex, timeout)))
+                    continue
+                # Await the oldest request of this call
+                i, left, request = inFlight.popleft()
+                nodeId, index, subindex, timeout = requests[i]
+                if request is None:
+                    ret = None
+                else:
+                    ret = awaitResponse(request, timeout)
+                    if ret is None and left:
+                        self.logger.warning('Repeat SDO read of node %d, '
+                                            'index %04X:%02X', nodeId, index,
+                                            subindex)
+                        self.cnt['SDO read retry'] += 1
+                        waiting[nodeId].appendleft((i, left - 1))
+                    elif ret is None and retries:
+                        self.logger.warning('SDO read of node %d, index '
+                                            '%04X:%02X failed after %d '
+                                            'retries', nodeId, index,
+                                            subindex, retries)
+                if ret is not None:
+                    results[i] = decodeRead(request[0], ret)
+                if waiting[nodeId]:
+                    ready.append(nodeId)
+        finally:
+            # Release the slots of the requests still in flight
+            for i, left, request in inFlight:
+                if request is not None:
+                    awaitResponse(request, requests[i][3])
+        return results
+
     def sdoWrite(self, nodeId, index, subindex, value, timeout=3000):
         """Write an object via |SDO| expedited write protocol
 
@@ -899,8 +1448,9 @@ class DCSControllerServer(object):
         """
 
         # Create the request message
-        self.logger.notice(f'Send SDO write request to node {nodeId}, object '
-                           f'{index:04X}:{subindex:X} with value {value:X}.')
+        self.logger.notice('Send SDO write request to node %d, object '
+                           '%04X:%X with value %X.', nodeId, index, subindex,
+                           value)
         self.cnt['SDO write total'] += 1
         if value < self.__od[index][subindex].minimum or \
                 value > self.__od[index][subindex].maximum:
@@ -908,44 +1458,33 @@ class DCSControllerServer(object):
                               f'range!')
             self.cnt['SDO write value range'] += 1
             return False
-        cobid = coc.COBID.SDO_RX + nodeId
-        datasize = len(f'{value:X}') // 2 + 1
-        data = value.to_bytes(4, 'little')
-        msg = [0 for i in range(8)]
-        msg[0] = (((0b00010 << 2) | (4 - datasize)) << 2) | 0b11
-        msg[1], msg[2] = index.to_bytes(2, 'little')
-        msg[3] = subindex
-        msg[4:] = [data[i] for i in range(4)]
+        cobid = SDO_RX_COBIDS[nodeId]
+        datasize = (value.bit_length() + 7) // 8 or 1
+        msg = SDO_WRITE_REQUEST.pack(SDO_WRITE_COMMANDS[datasize], index,
+                                     subindex, value)
+        # Register the request before sending it so that the response can not
+        # be missed by the reading thread
+        key = (nodeId, index, subindex)
+        ev = Event()
+        slot = []
+        self._registerSdoRequest(self.__sdoWritePending, key, ev, slot)
         # Send the request message
         try:
             self.writeMessage(cobid, msg)
         except CanGeneralError:
+            self._unregisterSdoRequest(self.__sdoWritePending, key, ev)
             self.cnt['SDO write request timeout'] += 1
             return False
         except analib.exception.DllException as ex:
+            self._unregisterSdoRequest(self.__sdoWritePending, key, ev)
             self.logger.exception(ex)
             self.cnt['SDO write request timeout'] += 1
             return False
 
-        # Read the response from the bus
-        t0 = time.perf_counter()
-        messageValid = False
-        while time.perf_counter() - t0 < timeout / 1000:
-            with self.lock:
-                for i, (cobid_ret, ret, dlc, flag, t) in \
-                        zip(range(len(self.__canMsgQueue)),
-                            self.__canMsgQueue):
-                    messageValid = \
-                        (dlc == 8 and cobid_ret == coc.COBID.SDO_TX + nodeId
-                         and ret[0] in [0x80, 0b1100000] and
-                         int.from_bytes([ret[1], ret[2]], 'little') == index
-                         and ret[3] == subindex)
-                    if messageValid:
-                        del self.__canMsgQueue[i]
-                        break
-            if messageValid:
-                break
-        else:
+        # Wait for the response from the bus
+        ret = self._waitSdoResponse(self.__sdoWritePending, key, ev, slot,
+                                    timeout)
+        if ret is None:
             self.logger.warning('SDO write timeout')
             self.cnt['SDO write timeout'] += 1
             return False
@@ -959,25 +1498,57 @@ class DCSControllerServer(object):
             return False
         else:
             self.logger.success('SDO write protocol successful!')
+        if index == 0x2000:
+            self.invalidatePsppCache()
         return True
 
+    def invalidatePsppCache(self):
+        """Discard the `ConnectedPSPPs` values cached by
+        :meth:`getConnectedPSPPs` so that they are read again on its next
+        call."""
+        self.__psppCacheVersion += 1
+
     def getConnectedPSPPs(self):
         """Read the `ConnectedPSPPs` |OD| attribute from the connected |DCS|
         Controllers. The received values are stored in the attribute
         :attr:`connectedPSPPs` and written to their corresponding |OPCUA| node.
+
+        Read values are cached until they are changed via :meth:`sdoWrite`,
+        the nodes are rescanned or :meth:`invalidatePsppCache` is called.
         """
         attr = 'ConnectedPSPPs'
+        # The OPC UA nodes of all SCB masters are written in one request at
+        # the end
+        updates = []
         for nodeId in self.__nodeIds:
             self.__connectedPSPPs[nodeId] = [[] for scb in range(4)]
             for scb in range(4):
-                val = None
-                while val is None:
+                version = self.__psppCacheVersion
+                cached = self.__psppCache.get((nodeId, scb))
+                if cached is not None and cached[0] == version:
+                    self.__connectedPSPPs[nodeId][scb] = list(cached[2])
+                    continue
+                # Retry a limited number of times with increasing pauses so
+                # that an unresponsive node can not block the start-up
+                for attempt in range(SDO_MAX_RETRIES):
                     val = self.sdoRead(nodeId, 0x2000, 1 + scb, 3000)
-                self.mypyDCs[nodeId][scb].ConnectedPSPPs = val
-                self.mypyDCs[nodeId][scb].write(attr)
-                self.__connectedPSPPs[nodeId][scb] = \
-                    [i for i in range(16) if int(f'{val:016b}'[::-1][i])]
-                self.logger.debug(f'Connected PSPPs: {val}')
+                    if val is not None:
+                        break
+                    time.sleep(0.01 * (1 << attempt))
+                else:
+                    self.logger.error(f'Could not read connected PSPPs of '
+                                      f'node {nodeId}, SCB {scb}.')
+                    continue
+                scbMaster = self.mypyDCs[nodeId][scb]
+                scbMaster.ConnectedPSPPs = val
+                updates.append((scbMaster, attr))
+                self.__connectedPSPPs[nodeId][scb] = decodeConnectedPSPPs(val)
+                # Store the version from before the read so that a concurrent
+                # invalidation is not lost
+                self.__psppCache[(nodeId, scb)] = \
+                    (version, val, tuple(self.__connectedPSPPs[nodeId][scb]))
+                self.logger.debug('Connected PSPPs: %s', val)
+        writeAttributes(updates)
 
     def scanNodes(self, timeout=100):
         """Do a complete scan over all |CAN| nodes
@@ -999,15 +1570,22 @@ class DCSControllerServer(object):
             |SDO| timeout in milliseconds
         """
         self.logger.notice('Scanning nodes. This will take a few seconds ...')
-        self.__nodeIds = list(range(1, 128))
         self.__mypyDCs = {}
-        for nodeId in range(1, 128):
-            dev_t = self.sdoRead(nodeId, 0x1000, 0, timeout)
+        self.invalidatePsppCache()
+        # The requests to different nodes are independent so they can be
+        # pipelined
+        devTypes = self.sdoReadMany([(nodeId, 0x1000, 0, timeout)
+                                     for nodeId in range(1, 128)])
+        # The results are in ascending node id order so responding nodes are
+        # simply appended
+        nodeIds = []
+        for nodeId, dev_t in zip(range(1, 128), devTypes):
             if dev_t is None:
-                self.logger.debug(f'Remove node id {nodeId}')
-                self.__nodeIds.remove(nodeId)
+                self.logger.debug('Remove node id %d', nodeId)
             else:
-                self.logger.success(f'Added node {nodeId}')
+                nodeIds.append(nodeId)
+                self.logger.success('Added node %d', nodeId)
+        self.__nodeIds = nodeIds
         if len(self.__nodeIds) == 0:
             raise BusEmptyError('No CAN nodes found!')
         self.logger.success('... Done!')
@@ -1020,8 +1598,8 @@ class DCSControllerServer(object):
                 self.logger.error(f'Node {nodeId} did not answer!')
                 # self.__nodeIds.remove(nodeId)
             else:
-                self.logger.info(f'Connection to node {nodeId} has been '
-                                 f'verified.')
+                self.logger.info('Connection to node %d has been verified.',
+                                 nodeId)
         self.logger.success('... Done!')
     
     def createOpcUaObjects(self):
@@ -1059,14 +1637,17 @@ class DCSControllerServer(object):
         self.logger.success('... Done!')
 
 
-def main():
-    """Wrapper function for using the server as a command line tool
+@functools.lru_cache(maxsize=1)
+def _buildParser():
+    """Create the command line argument parser of :func:`main`
 
-    The command line tool accepts arguments for configuring the server which
-    are tranferred to the :class:`DCSControllerServer` class.
-    """
+    The parser is only built once and reused on further calls.
 
-    # Parse arguments
+    Returns
+    -------
+    :class:`~argparse.ArgumentParser`
+        The argument parser
+    """
     parser = ArgumentParser(description='OPCUA CANopen server for DCS '
                             'Controller',
                             epilog='For more information contact '
@@ -1123,16 +1704,10 @@ def main():
     # Logging configuration
     lGroup = parser.add_argument_group('Logging settings')
     lGroup.add_argument('-c', '--console_loglevel',
-                        choices={'NOTSET', 'SPAM', 'DEBUG', 'VERBOSE', 'INFO',
-                                 'NOTICE', 'SUCCESS', 'WARNING', 'ERROR',
-                                 'CRITICAL'},
-                        default='NOTICE',
+                        choices=LOG_LEVELS, default='NOTICE',
                         help='Level of console logging')
     lGroup.add_argument('-f', '--file_loglevel',
-                        choices={'NOTSET', 'SPAM', 'DEBUG', 'VERBOSE', 'INFO',
-                                 'NOTICE', 'SUCCESS', 'WARNING', 'ERROR',
-                                 'CRITICAL'},
-                        default='INFO',
+                        choices=LOG_LEVELS, default='INFO',
                         help='Level of file logging')
     lGroup.add_argument('-d', '--logdir', metavar='LOGDIR',
                         default=os.path.join(scrdir, 'log'),
@@ -1141,7 +1716,18 @@ def main():
     # Program version
     parser.add_argument('-v', '--version', action='version',
                         version=__version__)
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Wrapper function for using the server as a command line tool
+
+    The command line tool accepts arguments for configuring the server which
+    are tranferred to the :class:`DCSControllerServer` class.
+    """
+
+    # Parse arguments
+    args = _buildParser().parse_args()
 
     # Start the server
     with DCSControllerServer(**vars(args)) as server:
@@ -18,6 +18,8 @@ Example
 :Contact: sebastian.scholz@cern.ch
 """
 
+import logging
+import time
 import coloredlogs as cl
 
 # Platform dependent imports
@@ -47,6 +49,34 @@ def extend_logging():
         cl.DEFAULT_LEVEL_STYLES['critical']['bold'] = cl.CAN_USE_BOLD_FONT
 
 
+class SecondCachingFormatter(logging.Formatter):
+    """:class:`~logging.Formatter` which formats the date and time of a
+    record only once per second.
+
+    The text of the current second is cached so that :func:`time.strftime` is
+    not called for every record. The output is the same as that of the base
+    class with its default time format. If a `datefmt` is given, the base
+    class implementation is used.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__cache = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        # Read and replace the cache as a whole so that the formatter can be
+        # shared between threads
+        cache = self.__cache
+        if cache[0] != sec:
+            cache = (sec, time.strftime(self.default_time_format,
+                                        self.converter(sec)))
+            self.__cache = cache
+        return self.default_msec_format % (cache[1], record.msecs)
+
+
 def removeAllHandlers(logger):
     """Ensure that all each :class:`~logging.FileHandler` is removed.
 
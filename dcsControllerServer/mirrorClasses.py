@@ -27,6 +27,29 @@ except (ModuleNotFoundError, ImportError):
 PERIOD_DEFAULT = 500
 """:obj:`int` : Default OPC UA publish interval in milliseconds"""
 
+
+def writeAttributes(items):
+    """Write attribute values of mirror objects to their |OPCUA| nodes in a
+    single write request.
+
+    Parameters
+    ----------
+    items : :obj:`list` of :obj:`tuple`
+        Pairs of a mirror object (child class of :class:`UaObject`) and the
+        name of the attribute to write. All objects have to belong to the same
+        |OPCUA| server.
+    """
+    params = ua.WriteParameters()
+    for obj, attr in items:
+        wv = ua.WriteValue()
+        wv.NodeId = obj.nodes[attr].nodeid
+        wv.AttributeId = ua.AttributeIds.Value
+        wv.Value = ua.DataValue(ua.Variant(getattr(obj, attr)))
+        params.NodesToWrite.append(wv)
+    if params.NodesToWrite:
+        for result in items[0][0].ua_node.server.write(params):
+            result.check()
+
 class SubHandler(object):
     """
     Subscription Handler. To receive events from server for a subscription.
@@ -180,6 +203,19 @@ class UaObject(object):
         else:
             self.nodes[attr].set_value(getattr(self, attr))
 
+    def writeMany(self, attrs):
+        """Write values of several attributes to their |OPCUA| nodes.
+
+        In contrast to calling :meth:`write` for each attribute all values are
+        sent in a single write request.
+
+        Parameters
+        ----------
+        attrs : :obj:`list` of :obj:`str`
+            The attributes to write
+        """
+        writeAttributes([(self, attr) for attr in attrs])
+
     def __str__(self):
         return f'Mirror class of node {self.d_name}.'
 
@@ -85,9 +85,8 @@ if __name__=='__main__':
         logger.info('Reading messages ...')
         while True:
             try:
-                cobid, data, dlc, flag, t = ch.getMessage()
-                logger.info(f'ID: {cobid:03X}; Data: {data.hex()}, DLC: {dlc}')
-            except analib.CanNoMsg:
-                pass
+                for cobid, data, dlc, flag, t in ch.getMessages():
+                    logger.info(f'ID: {cobid:03X}; Data: {data.hex()}, '
+                                f'DLC: {dlc}')
             except KeyboardInterrupt:
                 break